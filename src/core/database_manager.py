@@ -5,14 +5,115 @@ from PySide6.QtCore import QObject, Signal
 import sqlite3
 from pathlib import Path
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import traceback
 
+# MAX IDS PER "IN (...)" QUERY; OLDER SQLITE BUILDS CAP BOUND PARAMETERS AT 999
+_IN_CLAUSE_CHUNK = 500
+
+# PATIENT SEARCH SOURCE: EACH PATIENT WITH THE DATE OF THEIR LATEST REPORT
+_PATIENT_SEARCH_FROM = """
+               FROM patients p
+               LEFT JOIN (
+                   SELECT patient_id, MAX(report_date) AS latest_report_date
+                   FROM reports
+                   GROUP BY patient_id
+               ) AS latest_reports ON latest_reports.patient_id = p.patient_id
+           """
+# STORED AS "YYYY-MM-DD HH:MM:SS" TEXT, SO PLAIN STRING COMPARISONS ORDER CORRECTLY
+_PATIENT_VISIT_DATE_EXPR = "COALESCE(latest_reports.latest_report_date, p.date_created)"
+# SORT KEYS ACCEPTED BY search_patients/stream_patients order_by (A WHITELIST: NEVER INTERPOLATE INPUT)
+_PATIENT_SORT_COLUMNS = {
+   "patient_id": "p.patient_id",
+   "hospital": "p.hospital_name",
+   "name": "p.name",
+   "gender": "p.gender",
+   "age": "p.age",
+   "doctor": "p.doctor",
+   "visit_date": _PATIENT_VISIT_DATE_EXPR,
+}
+
+
+def _date_range_bounds(criteria):
+   """HALF-OPEN [FROM, TO) TIMESTAMP BOUNDS FOR date_from/date_to CRITERIA
+   
+   ACCEPTS FULL "YYYY-MM-DD HH:MM:SS" BOUNDS (date_to EXCLUSIVE) OR BARE DATES
+   (date_to INCLUSIVE, AS THE SEARCH DIALOGS USED TO SEND).
+   """
+   date_from = str(criteria["date_from"])
+   date_to = str(criteria["date_to"])
+   if len(date_from) == 10:
+       date_from += " 00:00:00"
+   if len(date_to) == 10:
+       next_day = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+       date_to = next_day.strftime("%Y-%m-%d 00:00:00")
+   return date_from, date_to
+
+# REPORT SEARCH PREVIEWS: LONG TEXT IS CUT TO THIS MANY CHARACTERS (ELLIPSIS INCLUDED) IN SQL
+_REPORT_PREVIEW_LENGTH = 50
+
+
+def _preview_expr(column):
+   """SQL FOR A TRUNCATED, NEVER-NULL DISPLAY PREVIEW OF A TEXT COLUMN"""
+   cut = _REPORT_PREVIEW_LENGTH - 3
+   return (
+       f"CASE WHEN LENGTH(r.{column}) > {_REPORT_PREVIEW_LENGTH} "
+       f"THEN SUBSTR(r.{column}, 1, {cut}) || '...' "
+       f"ELSE COALESCE(r.{column}, '') END AS {column}_preview"
+   )
+
+# FULL-TEXT INDEXES: TABLE -> (FTS TABLE, INDEXED COLUMNS). TRIGRAM TOKENS KEEP
+# THE SUBSTRING SEMANTICS OF LIKE '%x%' WHILE MATCHING THROUGH AN INDEX
+_FTS_TABLES = {
+   "patients": ("patients_fts", ("name", "doctor", "hospital_name")),
+   "reports": ("reports_fts", ("findings", "conclusions")),
+}
+_FTS_MIN_TERM_LENGTH = 3  # TRIGRAMS CANNOT MATCH SHORTER TERMS
+
+
+def _fts_phrase(column, term):
+   """BUILD A COLUMN-FILTERED FTS5 PHRASE, ESCAPING EMBEDDED QUOTES"""
+   return f'{column}:"{term.replace(chr(34), chr(34) * 2)}"'
+
+
+class PagedResult:
+   """QUERY RESULT STREAMED FROM AN OPEN CURSOR, HANDED OUT A PAGE AT A TIME
+   
+   THE CONNECTION MAY BE OPENED ON A WORKER THREAD AND READ ON THE GUI THREAD
+   (NEVER BOTH AT ONCE). IT IS CLOSED WHEN THE ROWS RUN OUT OR ON close().
+   """
+   
+   def __init__(self, conn, cursor):
+       self._conn = conn
+       self._cursor = cursor
+   
+   @property
+   def exhausted(self):
+       return self._cursor is None
+   
+   def fetch(self, size):
+       """RETURN UP TO size MORE ROWS AS DICTIONARIES"""
+       if self._cursor is None:
+           return []
+       rows = [dict(row) for row in self._cursor.fetchmany(size)]
+       if len(rows) < size:
+           self.close()
+       return rows
+   
+   def close(self):
+       """RELEASE THE CURSOR AND ITS CONNECTION (AND WITH THEM THE READ SNAPSHOT)"""
+       if self._cursor is not None:
+           self._cursor = None
+           self._conn.close()
+
 
 class DatabaseManager(QObject):
    """DATABASE MANAGER WITH ENHANCED LRU DROPDOWN HISTORY"""
    
+   # SET BY setup_full_text_search WHEN THIS SQLITE BUILD HAS FTS5 WITH TRIGRAMS
+   fts_enabled = False
+   
    # SIGNALS
    data_changed = Signal(str, dict)
    error_occurred = Signal(str)
@@ -43,9 +144,12 @@ class DatabaseManager(QObject):
            self.db_path.parent.mkdir(parents=True, exist_ok=True)
            
            with sqlite3.connect(str(self.db_path)) as conn:
+               # WAL LETS BACKUPS AND READERS RUN ALONGSIDE WRITERS
+               conn.execute("PRAGMA journal_mode=WAL")
                self.create_tables(conn)
                self.create_indices(conn)
                self.setup_triggers(conn)
+               self.setup_full_text_search(conn)
            
            self.backup_path = Path("data/database/backups")
            self.backup_path.mkdir(parents=True, exist_ok=True)
@@ -119,6 +223,20 @@ class DatabaseManager(QObject):
                    UNIQUE(field_name, value)
                )
            """,
+           "patient_id_seq": """
+               CREATE TABLE IF NOT EXISTS patient_id_seq (
+                   hospital TEXT NOT NULL,
+                   year TEXT NOT NULL,
+                   counter INTEGER NOT NULL,
+                   PRIMARY KEY (hospital, year)
+               )
+           """,
+           "id_sequences": """
+               CREATE TABLE IF NOT EXISTS id_sequences (
+                   name TEXT PRIMARY KEY,
+                   value INTEGER NOT NULL
+               )
+           """,
            "audit_log": """
                CREATE TABLE IF NOT EXISTS audit_log (
                    id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -142,6 +260,9 @@ class DatabaseManager(QObject):
        indices = [
            "CREATE INDEX IF NOT EXISTS idx_patient_id ON patients(patient_id)",
            "CREATE INDEX IF NOT EXISTS idx_report_patient ON reports(patient_id)",
+           "CREATE INDEX IF NOT EXISTS idx_report_date ON reports(report_date)",
+           "CREATE INDEX IF NOT EXISTS idx_report_patient_date ON reports(patient_id, report_date)",
+           "CREATE INDEX IF NOT EXISTS idx_patient_created ON patients(date_created)",
            "CREATE INDEX IF NOT EXISTS idx_image_report ON images(report_id)",
            "CREATE INDEX IF NOT EXISTS idx_dropdown_field ON dropdown_history(field_name)",
            "CREATE INDEX IF NOT EXISTS idx_dropdown_frequency ON dropdown_history(field_name, frequency DESC, last_used DESC)",
@@ -179,6 +300,84 @@ class DatabaseManager(QObject):
            cursor.execute(query)
        conn.commit()
    
+   def setup_full_text_search(self, conn):
+       """CREATE TRIGRAM FTS5 INDEXES OVER FREE-TEXT COLUMNS, KEPT IN SYNC BY TRIGGERS"""
+       try:
+           cursor = conn.cursor()
+           for table, (fts_table, columns) in _FTS_TABLES.items():
+               exists = cursor.execute(
+                   "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts_table,)
+               ).fetchone()
+               column_list = ", ".join(columns)
+               new_values = ", ".join(f"new.{column}" for column in columns)
+               old_values = ", ".join(f"old.{column}" for column in columns)
+               
+               cursor.execute(f"""
+                   CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+                   USING fts5({column_list}, content='{table}', content_rowid='id', tokenize='trigram')
+               """)
+               cursor.execute(f"""
+                   CREATE TRIGGER IF NOT EXISTS {fts_table}_insert AFTER INSERT ON {table}
+                   BEGIN
+                       INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});
+                   END;
+               """)
+               cursor.execute(f"""
+                   CREATE TRIGGER IF NOT EXISTS {fts_table}_delete AFTER DELETE ON {table}
+                   BEGIN
+                       INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                       VALUES ('delete', old.id, {old_values});
+                   END;
+               """)
+               cursor.execute(f"""
+                   CREATE TRIGGER IF NOT EXISTS {fts_table}_update AFTER UPDATE OF {column_list} ON {table}
+                   BEGIN
+                       INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                       VALUES ('delete', old.id, {old_values});
+                       INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});
+                   END;
+               """)
+               
+               # INDEX ROWS THAT PREDATE THE FTS TABLE
+               if not exists:
+                   cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+           
+           conn.commit()
+           self.fts_enabled = True
+       except sqlite3.OperationalError as e:
+           # NO FTS5 / TRIGRAM TOKENIZER (SQLITE < 3.34): SEARCHES KEEP USING LIKE
+           conn.rollback()
+           self.fts_enabled = False
+           logging.warning(f"Full-text search unavailable, using LIKE: {e}")
+   
+   def _text_search_filter(self, table, alias, criteria_columns, criteria):
+       """BUILD FILTERS FOR FREE-TEXT CRITERIA: ONE FTS MATCH WHERE POSSIBLE, LIKE OTHERWISE
+       
+       criteria_columns MAPS CRITERIA KEYS TO COLUMN NAMES. RETURNS (QUERY_PARTS, PARAMS).
+       """
+       fts_table, fts_columns = _FTS_TABLES[table]
+       query_parts = []
+       params = []
+       phrases = []
+       
+       for key, column in criteria_columns.items():
+           if key not in criteria:
+               continue
+           term = str(criteria[key])
+           if self.fts_enabled and column in fts_columns and len(term) >= _FTS_MIN_TERM_LENGTH:
+               phrases.append(_fts_phrase(column, term))
+           else:
+               query_parts.append(f"{alias}.{column} LIKE ?")
+               params.append(f"%{term}%")
+       
+       if phrases:
+           query_parts.append(
+               f"{alias}.id IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ?)"
+           )
+           params.append(" AND ".join(phrases))
+       
+       return query_parts, params
+   
    # PATIENT MANAGEMENT METHODS
    
    def add_patient(self, patient_data):
@@ -288,47 +487,126 @@ class DatabaseManager(QObject):
            self.error_occurred.emit(error_msg)
            raise
    
-   def search_patients(self, criteria, limit=None, offset=None):
-       """SEARCH PATIENTS BY VARIOUS CRITERIA"""
+   def _patient_search_filter(self, criteria):
+       """BUILD THE WHERE CLAUSE AND PARAMS SHARED BY search_patients AND count_patients"""
+       query_parts = []
+       params = []
+       
+       if "patient_id" in criteria:
+           query_parts.append("p.patient_id LIKE ?")
+           params.append(f"%{criteria['patient_id']}%")
+       
+       # NAME / DOCTOR / HOSPITAL GO THROUGH THE FULL-TEXT INDEX
+       text_parts, text_params = self._text_search_filter(
+           "patients", "p", {"name": "name", "doctor": "doctor", "hospital": "hospital_name"}, criteria
+       )
+       query_parts += text_parts
+       params += text_params
+       
+       if "date_from" in criteria and "date_to" in criteria:
+           query_parts.append(f"{_PATIENT_VISIT_DATE_EXPR} >= ? AND {_PATIENT_VISIT_DATE_EXPR} < ?")
+           params.extend(_date_range_bounds(criteria))
+       
+       where_clause = ""
+       if query_parts:
+           where_clause = " WHERE " + " AND ".join(query_parts)
+       return where_clause, params
+   
+   def next_patient_counter(self, hospital, year, count=1):
+       """ATOMICALLY ADVANCE THE PATIENT-ID COUNTER FOR A HOSPITAL AND YEAR BY count
+       
+       RETURNS THE LAST COUNTER RESERVED; THE BLOCK IS (RESULT - count + 1) .. RESULT.
+       """
+       conn = sqlite3.connect(str(self.db_path), isolation_level=None)
        try:
-           query_parts = []
-           params = []
-           
-           if "patient_id" in criteria:
-               query_parts.append("p.patient_id LIKE ?")
-               params.append(f"%{criteria['patient_id']}%")
-           
-           if "name" in criteria:
-               query_parts.append("p.name LIKE ?")
-               params.append(f"%{criteria['name']}%")
-           
-           if "doctor" in criteria:
-               query_parts.append("p.doctor LIKE ?")
-               params.append(f"%{criteria['doctor']}%")
-           
-           if "hospital" in criteria:
-               query_parts.append("p.hospital_name LIKE ?")
-               params.append(f"%{criteria['hospital']}%")
+           # UPSERT + READ IN ONE WRITE TRANSACTION (NO RETURNING: NEEDS SQLITE 3.35)
+           conn.execute("BEGIN IMMEDIATE")
+           conn.execute(
+               """
+               INSERT INTO patient_id_seq (hospital, year, counter) VALUES (?, ?, ?)
+               ON CONFLICT(hospital, year) DO UPDATE SET counter = counter + excluded.counter
+               """,
+               (hospital, year, count)
+           )
+           counter = conn.execute(
+               "SELECT counter FROM patient_id_seq WHERE hospital = ? AND year = ?",
+               (hospital, year)
+           ).fetchone()[0]
+           conn.execute("COMMIT")
+           return counter
            
-           visit_date_expr = "datetime(COALESCE(latest_reports.latest_report_date, p.date_created))"
-           if "date_from" in criteria and "date_to" in criteria:
-               query_parts.append(f"{visit_date_expr} BETWEEN datetime(?) AND datetime(?)")
-               params.append(f"{criteria['date_from']} 00:00:00")
-               params.append(f"{criteria['date_to']} 23:59:59")
-           
-           limit_clause = ""
-           if limit is not None:
-               try:
-                   limit_value = int(limit)
-                   if limit_value > 0:
-                       limit_clause = f" LIMIT {limit_value}"
-                       if offset:
-                           offset_value = max(0, int(offset))
-                           limit_clause += f" OFFSET {offset_value}"
-               except (TypeError, ValueError):
-                   logging.warning(f"Invalid limit/offset supplied to search_patients: limit={limit}, offset={offset}")
+       except Exception as e:
+           if conn.in_transaction:
+               conn.execute("ROLLBACK")
+           error_msg = f"Error allocating patient ID counter: {str(e)}"
+           logging.error(error_msg)
+           self.error_occurred.emit(error_msg)
+           raise
+       finally:
+           conn.close()
+   
+   def next_sequence_value(self, name):
+       """ATOMICALLY INCREMENT AND RETURN A NAMED SEQUENCE (E.G. REPORT NUMBERS), STARTING AT 1"""
+       conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+       try:
+           conn.execute("BEGIN IMMEDIATE")
+           conn.execute(
+               """
+               INSERT INTO id_sequences (name, value) VALUES (?, 1)
+               ON CONFLICT(name) DO UPDATE SET value = value + 1
+               """,
+               (name,)
+           )
+           value = conn.execute(
+               "SELECT value FROM id_sequences WHERE name = ?", (name,)
+           ).fetchone()[0]
+           conn.execute("COMMIT")
+           return value
            
-           base_query = """
+       except Exception as e:
+           if conn.in_transaction:
+               conn.execute("ROLLBACK")
+           error_msg = f"Error advancing sequence {name}: {str(e)}"
+           logging.error(error_msg)
+           self.error_occurred.emit(error_msg)
+           raise
+       finally:
+           conn.close()
+   
+   def seed_counters(self, patient_rows, sequences):
+       """SEED ID COUNTERS MIGRATED FROM SETTINGS IN ONE TRANSACTION
+       
+       patient_rows ARE (HOSPITAL, YEAR, COUNTER) AND sequences MAPS NAME -> VALUE;
+       AN EXISTING COUNTER IS NEVER MOVED BACKWARDS.
+       """
+       with sqlite3.connect(str(self.db_path)) as conn:
+           conn.executemany(
+               """
+               INSERT INTO patient_id_seq (hospital, year, counter) VALUES (?, ?, ?)
+               ON CONFLICT(hospital, year) DO UPDATE SET counter = MAX(counter, excluded.counter)
+               """,
+               patient_rows
+           )
+           conn.executemany(
+               """
+               INSERT INTO id_sequences (name, value) VALUES (?, ?)
+               ON CONFLICT(name) DO UPDATE SET value = MAX(value, excluded.value)
+               """,
+               sequences.items()
+           )
+   
+   def _patient_search_query(self, criteria, order_by=None):
+       """BUILD THE ORDERED PATIENT SEARCH QUERY (WITHOUT LIMIT) AND ITS PARAMETERS
+       
+       order_by IS (SORT KEY, DESCENDING); DEFAULTS TO LATEST VISIT FIRST.
+       """
+       sort_key, descending = order_by or ("visit_date", True)
+       if sort_key not in _PATIENT_SORT_COLUMNS:
+           raise ValueError(f"Unknown patient sort key: {sort_key}")
+       order_clause = f" ORDER BY {_PATIENT_SORT_COLUMNS[sort_key]} {'DESC' if descending else 'ASC'}"
+       
+       where_clause, params = self._patient_search_filter(criteria)
+       base_query = """
                SELECT
                    p.patient_id,
                    p.hospital_name,
@@ -341,23 +619,30 @@ class DatabaseManager(QObject):
                    p.designation,
                    p.date_created,
                    COALESCE(latest_reports.latest_report_date, p.date_created) AS visit_date
-               FROM patients p
-               LEFT JOIN (
-                   SELECT patient_id, MAX(report_date) AS latest_report_date
-                   FROM reports
-                   GROUP BY patient_id
-               ) AS latest_reports ON latest_reports.patient_id = p.patient_id
-           """
-           
-           if query_parts:
-               base_query += " WHERE " + " AND ".join(query_parts)
+           """ + _PATIENT_SEARCH_FROM
+       return f"{base_query}{where_clause}{order_clause}", params
+   
+   def search_patients(self, criteria, limit=None, offset=None, order_by=None):
+       """SEARCH PATIENTS BY VARIOUS CRITERIA"""
+       try:
+           query, params = self._patient_search_query(criteria, order_by)
            
-           query = f"{base_query} ORDER BY {visit_date_expr} DESC{limit_clause}"
+           limit_clause = ""
+           if limit is not None:
+               try:
+                   limit_value = int(limit)
+                   if limit_value > 0:
+                       limit_clause = f" LIMIT {limit_value}"
+                       if offset:
+                           offset_value = max(0, int(offset))
+                           limit_clause += f" OFFSET {offset_value}"
+               except (TypeError, ValueError):
+                   logging.warning(f"Invalid limit/offset supplied to search_patients: limit={limit}, offset={offset}")
            
            with sqlite3.connect(str(self.db_path)) as conn:
                conn.row_factory = sqlite3.Row
                cursor = conn.cursor()
-               cursor.execute(query, params)
+               cursor.execute(query + limit_clause, params)
                rows = cursor.fetchall()
                
                return [dict(row) for row in rows]
@@ -368,6 +653,43 @@ class DatabaseManager(QObject):
            self.error_occurred.emit(error_msg)
            raise
    
+   def stream_patients(self, criteria, order_by=None):
+       """SEARCH PATIENTS, RETURNING A PagedResult THAT READS ROWS ONLY AS THEY ARE ASKED FOR"""
+       conn = None
+       try:
+           query, params = self._patient_search_query(criteria, order_by)
+           
+           conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+           conn.row_factory = sqlite3.Row
+           cursor = conn.cursor()
+           cursor.execute(query, params)
+           return PagedResult(conn, cursor)
+           
+       except Exception as e:
+           if conn is not None:
+               conn.close()
+           error_msg = f"Error searching patients: {str(e)}"
+           logging.error(error_msg)
+           self.error_occurred.emit(error_msg)
+           raise
+   
+   def count_patients(self, criteria):
+       """COUNT PATIENTS MATCHING search_patients CRITERIA (FOR PAGED RESULT VIEWS)"""
+       try:
+           where_clause, params = self._patient_search_filter(criteria)
+           query = f"SELECT COUNT(*) {_PATIENT_SEARCH_FROM}{where_clause}"
+           
+           with sqlite3.connect(str(self.db_path)) as conn:
+               cursor = conn.cursor()
+               cursor.execute(query, params)
+               return cursor.fetchone()[0]
+               
+       except Exception as e:
+           error_msg = f"Error counting patients: {str(e)}"
+           logging.error(error_msg)
+           self.error_occurred.emit(error_msg)
+           raise
+   
    # REPORT MANAGEMENT METHODS
    
    def add_report(self, report_data):
@@ -497,8 +819,12 @@ class DatabaseManager(QObject):
            self.error_occurred.emit(error_msg)
            raise
 
-   def search_reports(self, criteria, limit=None, offset=None):
-       """SEARCH REPORTS BY VARIOUS CRITERIA"""
+   def search_reports(self, criteria, limit=None, offset=None, preview=False):
+       """SEARCH REPORTS BY VARIOUS CRITERIA
+       
+       WITH preview=True THE LONG TEXT COLUMNS ARE REPLACED BY findings_preview AND
+       conclusions_preview, TRUNCATED IN SQL SO FULL REPORT BODIES ARE NEVER READ OUT.
+       """
        try:
            query_parts = []
            params = []
@@ -512,14 +838,21 @@ class DatabaseManager(QObject):
                params.append(f"%{criteria['patient_id']}%")
            
            if "date_from" in criteria and "date_to" in criteria:
-               query_parts.append("datetime(report_date) BETWEEN datetime(?) AND datetime(?)")
-               params.append(f"{criteria['date_from']} 00:00:00")
-               params.append(f"{criteria['date_to']} 23:59:59")
+               # BARE COLUMN + HALF-OPEN RANGE SO idx_report_date CAN BE USED
+               query_parts.append("report_date >= ? AND report_date < ?")
+               params.extend(_date_range_bounds(criteria))
            
            if "status" in criteria:
                query_parts.append("status = ?")
                params.append(criteria["status"])
            
+           # FREE-TEXT FINDINGS / CONCLUSIONS GO THROUGH THE FULL-TEXT INDEX
+           text_parts, text_params = self._text_search_filter(
+               "reports", "r", {"findings": "findings", "conclusions": "conclusions"}, criteria
+           )
+           query_parts += text_parts
+           params += text_params
+           
            limit_clause = ""
            if limit is not None:
                try:
@@ -532,11 +865,18 @@ class DatabaseManager(QObject):
                except (TypeError, ValueError):
                    logging.warning(f"Invalid limit/offset supplied to search_reports: limit={limit}, offset={offset}")
            
-           base_query = "SELECT * FROM reports"
+           if preview:
+               base_query = (
+                   "SELECT r.id, r.report_id, r.patient_id, r.report_title, r.report_date, "
+                   f"r.status, r.last_modified, {_preview_expr('findings')}, "
+                   f"{_preview_expr('conclusions')} FROM reports r"
+               )
+           else:
+               base_query = "SELECT * FROM reports r"
            if query_parts:
                base_query += " WHERE " + " AND ".join(query_parts)
            
-           query = f"{base_query} ORDER BY datetime(report_date) DESC{limit_clause}"
+           query = f"{base_query} ORDER BY report_date DESC{limit_clause}"
            
            with sqlite3.connect(str(self.db_path)) as conn:
                conn.row_factory = sqlite3.Row
@@ -609,6 +949,63 @@ class DatabaseManager(QObject):
            self.error_occurred.emit(error_msg)
            raise
    
+   def get_report_bundle(self, report_ids):
+       """GET REPORTS WITH THEIR PATIENTS AND IMAGES IN ONE CONNECTION
+       
+       RETURNS {report_id: (report_data, patient_data, images)} KEYED BY THE IDS AS PASSED.
+       IMAGES ARE (PATH, LABEL) PAIRS LIKE get_report_images. IDS WITH NO REPORT ARE OMITTED.
+       """
+       try:
+           # MAP STORED TEXT IDS BACK TO THE CALLER'S IDS
+           requested = {str(report_id): report_id for report_id in report_ids}
+           ids = list(requested)
+           if not ids:
+               return {}
+           
+           reports = {}
+           patients = {}
+           images = {report_id: [] for report_id in ids}
+           
+           with sqlite3.connect(str(self.db_path)) as conn:
+               conn.row_factory = sqlite3.Row
+               cursor = conn.cursor()
+               
+               # CHUNK TO STAY UNDER SQLITE'S BOUND PARAMETER LIMIT
+               for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+                   chunk = ids[start:start + _IN_CLAUSE_CHUNK]
+                   marks = ",".join("?" * len(chunk))
+                   
+                   cursor.execute(f"SELECT * FROM reports WHERE report_id IN ({marks})", chunk)
+                   for row in cursor.fetchall():
+                       reports[str(row["report_id"])] = dict(row)
+                   
+                   cursor.execute(
+                       f"SELECT report_id, image_path, label FROM images "
+                       f"WHERE report_id IN ({marks}) ORDER BY report_id, sequence",
+                       chunk
+                   )
+                   for row in cursor.fetchall():
+                       images[str(row["report_id"])].append((row["image_path"], row["label"]))
+               
+               patient_ids = list({report["patient_id"] for report in reports.values()})
+               for start in range(0, len(patient_ids), _IN_CLAUSE_CHUNK):
+                   chunk = patient_ids[start:start + _IN_CLAUSE_CHUNK]
+                   marks = ",".join("?" * len(chunk))
+                   cursor.execute(f"SELECT * FROM patients WHERE patient_id IN ({marks})", chunk)
+                   for row in cursor.fetchall():
+                       patients[row["patient_id"]] = dict(row)
+           
+           return {
+               requested[key]: (report, patients.get(report["patient_id"]), images[key])
+               for key, report in reports.items()
+           }
+           
+       except Exception as e:
+           error_msg = f"Error retrieving report bundle: {str(e)}"
+           logging.error(error_msg)
+           self.error_occurred.emit(error_msg)
+           raise
+   
    # ENHANCED LRU DROPDOWN HISTORY MANAGEMENT
    
    def update_dropdown_history(self, field_name, value):
@@ -764,12 +1161,12 @@ class DatabaseManager(QObject):
            backup_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
            backup_file = self.backup_path / f"endoscopy_backup_{backup_timestamp}.db"
            
-           # CONNECT TO SOURCE AND DESTINATION DATABASES
-           source = sqlite3.connect(str(self.db_path))
+           # CONNECT TO SOURCE (READ-ONLY) AND DESTINATION DATABASES
+           source = sqlite3.connect(f"file:{self.db_path.as_posix()}?mode=ro", uri=True)
            destination = sqlite3.connect(str(backup_file))
            
-           # CREATE BACKUP
-           source.backup(destination)
+           # CREATE BACKUP IN CHUNKS SO WRITERS CAN INTERLEAVE
+           source.backup(destination, pages=1024, sleep=0)
            
            # CLOSE CONNECTIONS
            source.close()
@@ -792,6 +1189,8 @@ class DatabaseManager(QObject):
                # EXECUTE SIMPLE QUERY TO ENSURE PENDING TRANSACTIONS ARE COMMITTED
                conn.execute("SELECT 1")
                conn.commit()
+               # FOLD THE WAL BACK INTO THE MAIN FILE SO IT CAN BE COPIED ALONE
+               conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
            
            logging.info("Database connections closed")
            return True
@@ -1,5 +1,9 @@
 # ERROR HANDLING AND LOGGING SYSTEM
+import json
 import logging
+import os
+import shutil
+import sqlite3
 import traceback
 import sys
 from pathlib import Path
@@ -7,6 +11,14 @@ from datetime import datetime
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtCore import QObject, Signal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_SQL_UPDATE_IMG_PATH = "UPDATE images SET image_path = ? WHERE id = ?"
+
 
 class ErrorHandler(QObject):
     """Comprehensive error handling and logging system
@@ -26,6 +38,7 @@ class ErrorHandler(QObject):
             parent: Parent QObject
         """
         super().__init__(parent)
+        self._error_contexts = {}
         self.setup_logging()
         self.install_exception_hook()
     
@@ -90,11 +103,10 @@ class ErrorHandler(QObject):
     @staticmethod
     def _sanitize_message(message):
         """Convert message to ASCII-safe string to avoid encoding errors on some consoles."""
-        try:
-            if isinstance(message, str):
-                return message.encode("ascii", errors="replace").decode("ascii")
-        except Exception:
-            pass
+        if type(message) is str:
+            if message.isascii():
+                return message
+            return message.encode("ascii", errors="replace").decode("ascii")
         return str(message)
     
     def exception_hook(self, exc_type, exc_value, exc_traceback):
@@ -105,13 +117,11 @@ class ErrorHandler(QObject):
             exc_value: Exception value
             exc_traceback: Exception traceback
         """
-        # Format traceback
-        tb_lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
-        tb_text = ''.join(tb_lines)
-        
-        # Log the error
+        # Log the error (traceback is formatted only if a handler will emit it)
         self.app_logger.critical(
-            f"Unhandled exception: {exc_type.__name__}: {exc_value}\n{tb_text}"
+            "Unhandled exception: %s: %s",
+            exc_type.__name__, exc_value,
+            exc_info=(exc_type, exc_value, exc_traceback)
         )
         
         # Emit signal for UI notification
@@ -134,7 +144,7 @@ class ErrorHandler(QObject):
             tb_text = ''.join(traceback.format_tb(traceback_obj))
             error_details = f"{message}\n{tb_text}"
         
-        self.app_logger.error(f"{error_type}: {error_details}")
+        self.app_logger.error("%s: %s", error_type, error_details)
         self.error_occurred.emit(error_type, error_details)
     
     def log_warning(self, message):
@@ -196,10 +206,6 @@ class ErrorHandler(QObject):
     def recover_database(self):
         """Attempt to recover database from backup"""
         try:
-            from pathlib import Path
-            import sqlite3
-            import shutil
-            
             # Log recovery attempt
             self.app_logger.warning("Attempting database recovery")
             
@@ -221,31 +227,48 @@ class ErrorHandler(QObject):
             backups.sort(key=lambda p: p.stat().st_mtime, reverse=True)
             latest_backup = backups[0]
             
-            # Backup current database (even if corrupted)
+            # Fold committed WAL pages into the main file if SQLite still can
+            try:
+                conn = sqlite3.connect(str(db_path))
+                try:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                self.app_logger.warning("WAL checkpoint before recovery failed: %s", e)
+            
+            # Backup current database (even if corrupted) with its -wal/-shm files
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             corrupted_path = backup_dir / f"corrupted_{timestamp}.db"
             shutil.copy2(db_path, corrupted_path)
+            for suffix in ("-wal", "-shm"):
+                sidecar = db_path.with_name(db_path.name + suffix)
+                if sidecar.exists():
+                    shutil.copy2(sidecar, corrupted_path.with_name(corrupted_path.name + suffix))
+                    # A stale WAL would be replayed onto the restored file, so remove it
+                    sidecar.unlink()
             
             # Restore from backup
             shutil.copy2(latest_backup, db_path)
             
             self.app_logger.info(
-                f"Database recovery successful. Restored from {latest_backup.name}"
+                "Database recovery successful. Restored from %s", latest_backup.name
             )
             
             return True, f"Database successfully recovered from {latest_backup.name}"
             
+        except FileNotFoundError as e:
+            error_msg = f"Database recovery failed: {str(e)}"
+            self.app_logger.warning(error_msg)
+            return False, error_msg
         except Exception as e:
             error_msg = f"Database recovery failed: {str(e)}"
-            self.app_logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.app_logger.error(error_msg, exc_info=True)
             return False, error_msg
     
     def recover_auto_save(self):
         """Recover from auto-save if available"""
         try:
-            from pathlib import Path
-            import json
-            
             # Log recovery attempt
             self.app_logger.warning("Attempting to recover from auto-save")
             
@@ -254,9 +277,10 @@ class ErrorHandler(QObject):
             if not auto_save_path.exists():
                 raise FileNotFoundError("Auto-save file not found")
                 
-            # Validate JSON
-            with open(auto_save_path, "r") as f:
-                state_data = json.load(f)
+            # Validate JSON (orjson when installed, stdlib otherwise)
+            with open(auto_save_path, "rb") as f:
+                raw_data = f.read()
+            state_data = orjson.loads(raw_data) if orjson else json.loads(raw_data)
                 
             if not state_data:
                 raise ValueError("Auto-save file is empty or invalid")
@@ -265,17 +289,19 @@ class ErrorHandler(QObject):
             
             return True, state_data
             
+        except (FileNotFoundError, ValueError) as e:
+            # Also covers json.JSONDecodeError, a ValueError subclass
+            error_msg = f"Auto-save recovery failed: {str(e)}"
+            self.app_logger.warning(error_msg)
+            return False, error_msg
         except Exception as e:
             error_msg = f"Auto-save recovery failed: {str(e)}"
-            self.app_logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.app_logger.error(error_msg, exc_info=True)
             return False, error_msg
     
     def repair_corrupted_images(self):
         """Attempt to repair corrupted image references"""
         try:
-            import sqlite3
-            from pathlib import Path
-            
             # Log repair attempt
             self.app_logger.warning("Attempting to repair corrupted image references")
             
@@ -283,8 +309,8 @@ class ErrorHandler(QObject):
             if not db_path.exists():
                 raise FileNotFoundError("Database file not found")
                 
-            # Connect to database
-            conn = sqlite3.connect(db_path)
+            # Connect to database with explicit transaction control
+            conn = sqlite3.connect(db_path, isolation_level=None)
             cursor = conn.cursor()
             
             # Find images with non-existent paths
@@ -293,45 +319,59 @@ class ErrorHandler(QObject):
             
             repaired_count = 0
             removed_count = 0
+            captured_dir = Path("data/images/captured")
             
-            for image_id, report_id, image_path in all_images:
-                if not Path(image_path).exists():
-                    # Try to find the image in captured images directory
-                    image_name = Path(image_path).name
-                    captured_dir = Path("data/images/captured")
-                    
-                    # Search for the image by name
-                    matches = list(captured_dir.glob(f"*{image_name}*"))
-                    
-                    if matches:
-                        # Update with found path
-                        cursor.execute(
-                            "UPDATE images SET image_path = ? WHERE id = ?",
-                            (str(matches[0]), image_id)
-                        )
-                        repaired_count += 1
-                        self.app_logger.info(f"Repaired image path: {image_id} -> {matches[0]}")
-                    else:
-                        # Mark as missing but don't delete
-                        cursor.execute(
-                            "UPDATE images SET image_path = ? WHERE id = ?",
-                            ("MISSING_" + image_path, image_id)
-                        )
-                        removed_count += 1
-                        self.app_logger.warning(f"Marked missing image: {image_id}")
-            
-            conn.commit()
-            conn.close()
+            try:
+                # One write transaction for the whole repair
+                cursor.execute("BEGIN IMMEDIATE")
+                
+                for image_id, report_id, image_path in all_images:
+                    if not os.path.exists(image_path):
+                        # Try to find the image in captured images directory
+                        image_name = os.path.basename(image_path)
+                        
+                        # Search for the image by name
+                        matches = list(captured_dir.glob(f"*{image_name}*"))
+                        
+                        if matches:
+                            # Update with found path
+                            cursor.execute(
+                                _SQL_UPDATE_IMG_PATH,
+                                (str(matches[0]), image_id)
+                            )
+                            repaired_count += 1
+                            self.app_logger.info("Repaired image path: %s -> %s", image_id, matches[0])
+                        else:
+                            # Mark as missing but don't delete
+                            cursor.execute(
+                                _SQL_UPDATE_IMG_PATH,
+                                ("MISSING_" + image_path, image_id)
+                            )
+                            removed_count += 1
+                            self.app_logger.warning("Marked missing image: %s", image_id)
+                
+                cursor.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    cursor.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
             
             self.app_logger.info(
-                f"Image repair completed: {repaired_count} repaired, {removed_count} marked as missing"
+                "Image repair completed: %d repaired, %d marked as missing",
+                repaired_count, removed_count
             )
             
             return True, f"Image repair completed: {repaired_count} repaired, {removed_count} marked as missing"
             
+        except FileNotFoundError as e:
+            error_msg = f"Image repair failed: {str(e)}"
+            self.app_logger.warning(error_msg)
+            return False, error_msg
         except Exception as e:
             error_msg = f"Image repair failed: {str(e)}"
-            self.app_logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.app_logger.error(error_msg, exc_info=True)
             return False, error_msg
     
     # CONTEXT MANAGER FOR ERROR HANDLING
@@ -347,13 +387,21 @@ class ErrorHandler(QObject):
             context_name: Name of the operation context
             
         Returns:
-            Context manager object
+            Context manager object (shared per context name)
         """
-        return ErrorContext(self, context_name)
+        context = self._error_contexts.get(context_name)
+        if context is None:
+            context = ErrorContext(self, context_name)
+            self._error_contexts[context_name] = context
+        return context
 
 
 class ErrorContext:
-    """Context manager for error handling"""
+    """Context manager for error handling
+
+    Instances hold no per-use state, so ErrorHandler reuses one
+    instance per context name.
+    """
     
     def __init__(self, error_handler, context_name):
         """Initialize the error context
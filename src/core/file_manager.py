@@ -1,14 +1,181 @@
 # FIXED FILE_MANAGER.PY - RESOLVED PATH CONCATENATION ISSUES
 # FILE: src/core/file_manager.py
 
-from PySide6.QtCore import QObject, Signal, QDateTime
+from PySide6.QtCore import QObject, Signal
 from pathlib import Path
 import os
 import shutil
+import sys
 import logging
-import traceback
-from datetime import datetime
-import json
+import time
+import re
+import functools
+
+
+# strftime format used for timestamped filenames
+_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Already-compressed formats that are stored in backups without deflate
+_STORED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".mp4", ".mov", ".avi", ".pdf"})
+
+# Buffer size for copying file-like objects (1 MiB)
+_COPY_BUFSIZE = 1024 * 1024
+
+# Fixed subdirectory suffixes of the hospital/patient folder layout
+_SEP_REPORTS = os.sep + "Reports"
+_SEP_MEDIA = os.sep + "Media"
+_SEP_IMAGES = os.sep + "Images"
+_SEP_VIDEOS = os.sep + "Videos"
+
+# Upper bound on cached hospital/patient directory lookups (FIFO eviction)
+_DIR_LOOKUP_CACHE_SIZE = 128
+
+
+# Characters that are invalid in filenames, mapped to underscores
+_INVALID_CHARS = '<>:"/\\|?*'
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys(_INVALID_CHARS, '_'))
+# Matches anything _sanitize_filename would rewrite
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*\s]')
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_filename(filename):
+    """Sanitize a non-empty filename string (memoized, see FileManager.sanitize_filename)
+    
+    Args:
+        filename: Original filename as str
+        
+    Returns:
+        Sanitized filename
+    """
+    # Fast path: short names with nothing to replace are returned as-is
+    if len(filename) <= 50 and not _UNSAFE_FILENAME_RE.search(filename):
+        return filename
+    
+    # Remove or replace invalid characters
+    sanitized = filename.translate(_SANITIZE_TABLE)
+    
+    # Remove extra spaces and replace with underscores
+    sanitized = '_'.join(sanitized.split())
+    
+    # Limit length
+    if len(sanitized) > 50:
+        sanitized = sanitized[:50]
+    
+    return sanitized
+
+
+def _fspath(path):
+    """Return a path as str, skipping the conversion when it already is one
+    
+    Args:
+        path: str or os.PathLike path
+        
+    Returns:
+        Path as a string
+    """
+    return path if type(path) is str else os.fspath(path)
+
+
+# Preallocating file blocks is only worthwhile (and reliable) on Linux
+_PREALLOCATE = sys.platform.startswith("linux") and hasattr(os, "posix_fallocate")
+
+
+def _write_bytes(path, data):
+    """Write a bytes-like object to a new file through a raw descriptor
+    
+    Avoids the buffered file object's extra copy and, on Linux, reserves
+    the file's blocks up front with posix_fallocate.
+    
+    Args:
+        path: Destination file path
+        data: bytes, bytearray or memoryview to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data).cast("B")
+        if _PREALLOCATE and view.nbytes:
+            try:
+                os.posix_fallocate(fd, 0, view.nbytes)
+            except OSError:
+                pass  # Filesystem does not support preallocation
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _iter_files(directory):
+    """Recursively yield os.DirEntry objects for regular files
+    
+    Uses os.scandir so file type and stat results come from the
+    directory listing instead of separate Path lookups.
+    
+    Args:
+        directory: Directory to walk
+        
+    Yields:
+        os.DirEntry for every file below the directory
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+# Directory file descriptors for scandir/unlink are POSIX-only
+_DIR_FD_SUPPORTED = os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd
+
+
+def _remove_files_older_than(directory, cutoff_ns):
+    """Recursively delete regular files modified before a cutoff
+    
+    On POSIX the directory is opened once and entries are stat'ed and
+    unlinked relative to its file descriptor, so each path is resolved
+    only once. Other platforms fall back to full paths.
+    
+    Args:
+        directory: Directory to clean
+        cutoff_ns: Modification time cutoff in nanoseconds since the epoch
+        
+    Returns:
+        Number of files deleted
+    """
+    deleted_count = 0
+    
+    if not _DIR_FD_SUPPORTED:
+        for entry in _iter_files(directory):
+            if entry.stat().st_mtime_ns < cutoff_ns:
+                os.unlink(entry.path)
+                deleted_count += 1
+        return deleted_count
+    
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except FileNotFoundError:
+        return 0
+    
+    try:
+        with os.scandir(dir_fd) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    deleted_count += _remove_files_older_than(
+                        os.path.join(directory, entry.name), cutoff_ns
+                    )
+                elif (entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime_ns < cutoff_ns):
+                    os.unlink(entry.name, dir_fd=dir_fd)
+                    deleted_count += 1
+    finally:
+        os.close(dir_fd)
+    
+    return deleted_count
 
 
 class FileManager(QObject):
@@ -31,26 +198,42 @@ class FileManager(QObject):
         """
         super().__init__(parent)
         self.settings = settings_manager
-        self.setup_logging()
+        self._dir_cache = set()  # Directories already known to exist
+        self._hospital_dir_cache = {}  # hospital_name -> hospital_dirs
+        self._patient_dir_cache = {}  # (hospital, name, id) -> patient_dirs
+        self._dev_cache = {}  # directory -> st_dev, for same-filesystem moves
+        self._logger = None  # Created on first use by the logger property
         self.initialize_base_directories()
     
+    @property
+    def logger(self):
+        """FileManager logger, configured on first access"""
+        if self._logger is None:
+            self.setup_logging()
+        return self._logger
+    
     def setup_logging(self):
         """Setup logging configuration"""
-        self.logger = logging.getLogger("FileManager")
+        logger = logging.getLogger("FileManager")
         
-        if not self.logger.handlers:
-            log_path = Path("data/logs/file_manager.log")
-            log_path.parent.mkdir(parents=True, exist_ok=True)
+        if not logger.handlers:
+            log_path = self.base_dirs["logs"] / "file_manager.log"
+            self._ensure_dir(log_path.parent)
             
             file_handler = logging.FileHandler(log_path)
             formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
             file_handler.setFormatter(formatter)
             
-            self.logger.addHandler(file_handler)
-            self.logger.setLevel(logging.INFO)
+            logger.addHandler(file_handler)
+            logger.setLevel(logging.INFO)
+        
+        self._logger = logger
     
     def initialize_base_directories(self):
-        """Create base directory structure"""
+        """Define the base directory structure
+        
+        Directories are created on first use through _ensure_dir.
+        """
         self.base_dirs = {
             "data": Path("data"),
             "hospitals": Path("data/hospitals"),  # NEW: Hospital-based structure
@@ -61,11 +244,62 @@ class FileManager(QObject):
             "settings": Path("data/settings"),
         }
         
-        # Create base directories
-        for path in self.base_dirs.values():
-            path.mkdir(parents=True, exist_ok=True)
+        # Hospital paths are built by string concatenation from this prefix
+        self._hospitals_prefix = _fspath(self.base_dirs["hospitals"]) + os.sep
+    
+    def _ensure_dir(self, path):
+        """Create a directory once and remember that it exists
         
-        self.logger.info("Base directory structure initialized")
+        Args:
+            path: Directory path to create
+        """
+        key = _fspath(path)
+        if key in self._dir_cache:
+            return
+        Path(path).mkdir(parents=True, exist_ok=True)
+        self._dir_cache.add(key)
+    
+    def _move_file(self, source, destination, source_dev):
+        """Move a file, renaming in place when both sides share a filesystem
+        
+        Args:
+            source: Source file path (str)
+            destination: Destination file path (str)
+            source_dev: st_dev of the source file
+        """
+        dest_dir = os.path.dirname(destination) or "."
+        dest_dev = self._dev_cache.get(dest_dir)
+        if dest_dev is None:
+            dest_dev = os.stat(dest_dir).st_dev
+            self._dev_cache[dest_dir] = dest_dev
+        
+        if source_dev == dest_dev:
+            try:
+                # os.replace overwrites an existing destination on Windows too
+                os.replace(source, destination)
+                return
+            except OSError:
+                pass  # e.g. EXDEV across bind mounts that share st_dev
+        # Cross-device: shutil.move copies and deletes
+        shutil.move(source, destination)
+    
+    @staticmethod
+    def _ts():
+        """Return the current local time formatted for filenames"""
+        return time.strftime(_TIMESTAMP_FORMAT)
+    
+    @staticmethod
+    def _cache_store(cache, key, value):
+        """Store a lookup result, evicting the oldest entry when full
+        
+        Args:
+            cache: Dictionary used as the cache
+            key: Cache key
+            value: Value to store
+        """
+        if len(cache) >= _DIR_LOOKUP_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
     
     def get_hospital_directory(self, hospital_name):
         """Get or create hospital directory structure
@@ -74,26 +308,32 @@ class FileManager(QObject):
             hospital_name: Name of the hospital
             
         Returns:
-            Dictionary with hospital directory paths
+            Dictionary with hospital directory paths (str)
         """
+        cached = self._hospital_dir_cache.get(hospital_name)
+        if cached is not None:
+            return cached
+        cache_key = hospital_name
+        
         if not hospital_name:
             hospital_name = "Default_Hospital"
         
         # Sanitize hospital name for filesystem
         safe_hospital_name = self.sanitize_filename(hospital_name)
         
-        hospital_base = self.base_dirs["hospitals"] / safe_hospital_name
+        hospital_base = self._hospitals_prefix + safe_hospital_name
         
         hospital_dirs = {
             "base": hospital_base,
-            "reports": hospital_base / "Reports",
-            "media": hospital_base / "Media",
+            "reports": hospital_base + _SEP_REPORTS,
+            "media": hospital_base + _SEP_MEDIA,
         }
         
         # Create hospital directories
         for path in hospital_dirs.values():
-            path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path)
         
+        self._cache_store(self._hospital_dir_cache, cache_key, hospital_dirs)
         return hospital_dirs
     
     def get_patient_media_directory(self, hospital_name, patient_name, patient_id):
@@ -105,8 +345,13 @@ class FileManager(QObject):
             patient_id: Patient ID
             
         Returns:
-            Dictionary with patient media directory paths
+            Dictionary with patient media directory paths (str)
         """
+        cache_key = (hospital_name, patient_name, patient_id)
+        cached = self._patient_dir_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         hospital_dirs = self.get_hospital_directory(hospital_name)
         
         # Create patient identifier
@@ -114,18 +359,19 @@ class FileManager(QObject):
         safe_patient_id = self.sanitize_filename(patient_id) if patient_id else "No_ID"
         patient_folder = f"{safe_patient_name}_{safe_patient_id}"
         
-        patient_base = hospital_dirs["media"] / patient_folder
+        patient_base = hospital_dirs["media"] + os.sep + patient_folder
         
         patient_dirs = {
             "base": patient_base,
-            "images": patient_base / "Images",
-            "videos": patient_base / "Videos",
+            "images": patient_base + _SEP_IMAGES,
+            "videos": patient_base + _SEP_VIDEOS,
         }
         
         # Create patient directories
         for path in patient_dirs.values():
-            path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path)
         
+        self._cache_store(self._patient_dir_cache, cache_key, patient_dirs)
         return patient_dirs
     
     def sanitize_filename(self, filename):
@@ -141,28 +387,15 @@ class FileManager(QObject):
             return "Unknown"
         
         # Convert to string if it's not
-        filename = str(filename)
-        
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = filename
-        
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '_')
-        
-        # Remove extra spaces and replace with underscores
-        sanitized = '_'.join(sanitized.split())
-        
-        # Limit length
-        if len(sanitized) > 50:
-            sanitized = sanitized[:50]
-        
-        return sanitized
+        return _sanitize_filename(str(filename))
     
     def get_file_path(self, file_type, filename=None, hospital_name=None, 
                      patient_name=None, patient_id=None, use_timestamp=True):
         """Generate a path for a new file with hospital-based structure - FIXED PATH CONCATENATION
         
+        Dispatches to the per-type builders (_image_path, _video_path,
+        _report_path); other file types go to the temp directory.
+        
         Args:
             file_type: Type of file ('image', 'video', 'report')
             filename: Base filename (optional)
@@ -175,65 +408,101 @@ class FileManager(QObject):
             Path object for the new file
         """
         try:
-            if file_type in ["image", "video"]:
-                # Media files go to patient directories
-                if not hospital_name or not patient_name:
-                    # Fallback to old structure if missing info
-                    directory = self.base_dirs["data"] / f"{file_type}s" / "captured"  # FIXED: STRING CONCATENATION
-                    directory.mkdir(parents=True, exist_ok=True)
-                else:
-                    patient_dirs = self.get_patient_media_directory(hospital_name, patient_name, patient_id)
-                    directory = patient_dirs["images"] if file_type == "image" else patient_dirs["videos"]
-                
-            elif file_type == "report":
-                # Reports go to hospital reports directory
-                if not hospital_name:
-                    directory = self.base_dirs["data"] / "reports"
-                    directory.mkdir(parents=True, exist_ok=True)
-                else:
-                    hospital_dirs = self.get_hospital_directory(hospital_name)
-                    directory = hospital_dirs["reports"]
-                
-            else:
-                # Other files go to temp
-                directory = self.base_dirs["temp"]
-            
-            # Generate filename if not provided
+            if file_type == "image":
+                return self._image_path(filename, hospital_name, patient_name, patient_id, use_timestamp)
+            if file_type == "video":
+                return self._video_path(filename, hospital_name, patient_name, patient_id, use_timestamp)
+            if file_type == "report":
+                return self._report_path(filename, hospital_name, patient_name, patient_id, use_timestamp)
+            
+            # Other files go to temp
+            directory = self.base_dirs["temp"]
+            self._ensure_dir(directory)
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                
-                if file_type == "image":
-                    filename = f"img_{timestamp}.jpg"
-                elif file_type == "video":
-                    filename = f"vid_{timestamp}.mp4"
-                elif file_type == "report":
-                    # Use patient name and date for report filename
-                    if patient_name and patient_id:
-                        safe_name = self.sanitize_filename(patient_name)
-                        safe_id = self.sanitize_filename(patient_id)
-                        date_str = datetime.now().strftime("%Y-%m-%d")
-                        filename = f"{safe_name}_{safe_id}_{date_str}.pdf"
-                    else:
-                        filename = f"report_{timestamp}.pdf"
-                else:
-                    filename = f"file_{timestamp}.tmp"
-            else:
-                # Add timestamp to existing filename if requested
-                if use_timestamp:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    # FIXED: PROPER STRING HANDLING
-                    filename_str = str(filename)
-                    name, ext = os.path.splitext(filename_str)
-                    filename = f"{name}_{timestamp}{ext}"
-            
-            # FIXED: ENSURE BOTH DIRECTORY AND FILENAME ARE PROPER TYPES
-            return Path(directory) / str(filename)
+                filename = f"file_{self._ts()}.tmp"
+            elif use_timestamp:
+                filename = self._timestamped(filename)
+            return Path(f"{directory}{os.sep}{filename}")
             
         except Exception as e:
             self.logger.error(f"Error generating file path: {e}")
             # Fallback to temp directory
+            self._ensure_dir(self.base_dirs["temp"])
             return self.base_dirs["temp"] / str(filename or "error_file.tmp")
     
+    def _timestamped(self, filename):
+        """Insert the current timestamp before a filename's extension
+        
+        Args:
+            filename: Original filename
+            
+        Returns:
+            Filename with timestamp suffix
+        """
+        name, ext = os.path.splitext(str(filename))
+        return f"{name}_{self._ts()}{ext}"
+    
+    def _media_directory(self, subdir, hospital_name, patient_name, patient_id):
+        """Resolve the directory for captured media
+        
+        Args:
+            subdir: 'images' or 'videos'
+            hospital_name: Hospital name for organization
+            patient_name: Patient name
+            patient_id: Patient ID
+            
+        Returns:
+            Directory path for the media file
+        """
+        if hospital_name and patient_name:
+            return self.get_patient_media_directory(hospital_name, patient_name, patient_id)[subdir]
+        # Fallback to old structure if missing info
+        directory = self.base_dirs["data"] / subdir / "captured"
+        self._ensure_dir(directory)
+        return directory
+    
+    def _image_path(self, filename=None, hospital_name=None, patient_name=None,
+                    patient_id=None, use_timestamp=True):
+        """Build the path for a new image file (see get_file_path)"""
+        directory = self._media_directory("images", hospital_name, patient_name, patient_id)
+        if not filename:
+            filename = f"img_{self._ts()}.jpg"
+        elif use_timestamp:
+            filename = self._timestamped(filename)
+        return Path(f"{directory}{os.sep}{filename}")
+    
+    def _video_path(self, filename=None, hospital_name=None, patient_name=None,
+                    patient_id=None, use_timestamp=True):
+        """Build the path for a new video file (see get_file_path)"""
+        directory = self._media_directory("videos", hospital_name, patient_name, patient_id)
+        if not filename:
+            filename = f"vid_{self._ts()}.mp4"
+        elif use_timestamp:
+            filename = self._timestamped(filename)
+        return Path(f"{directory}{os.sep}{filename}")
+    
+    def _report_path(self, filename=None, hospital_name=None, patient_name=None,
+                     patient_id=None, use_timestamp=True):
+        """Build the path for a new report file (see get_file_path)"""
+        # Reports go to hospital reports directory
+        if hospital_name:
+            directory = self.get_hospital_directory(hospital_name)["reports"]
+        else:
+            directory = self.base_dirs["data"] / "reports"
+            self._ensure_dir(directory)
+        
+        if not filename:
+            # Use patient name and date for report filename
+            if patient_name and patient_id:
+                safe_name = self.sanitize_filename(patient_name)
+                safe_id = self.sanitize_filename(patient_id)
+                filename = f"{safe_name}_{safe_id}_{time.strftime('%Y-%m-%d')}.pdf"
+            else:
+                filename = f"report_{self._ts()}.pdf"
+        elif use_timestamp:
+            filename = self._timestamped(filename)
+        return Path(f"{directory}{os.sep}{filename}")
+    
     def save_captured_image(self, image_data, filename=None, hospital_name=None, 
                            patient_name=None, patient_id=None):
         """Save a captured image to the appropriate directory
@@ -250,29 +519,25 @@ class FileManager(QObject):
         """
         try:
             # Get target path
-            image_path = self.get_file_path("image", filename, hospital_name, 
-                                          patient_name, patient_id)
-            
-            # Ensure directory exists
-            image_path.parent.mkdir(parents=True, exist_ok=True)
+            image_path = _fspath(self._image_path(filename, hospital_name,
+                                                 patient_name, patient_id))
             
             # Save the image
-            if isinstance(image_data, bytes):
-                with open(image_path, "wb") as f:
-                    f.write(image_data)
+            if isinstance(image_data, (bytes, bytearray, memoryview)):
+                _write_bytes(image_path, image_data)
             else:
                 # Assume file-like object
                 with open(image_path, "wb") as f:
-                    shutil.copyfileobj(image_data, f)
+                    shutil.copyfileobj(image_data, f, _COPY_BUFSIZE)
             
             self.logger.info(f"Saved captured image: {image_path}")
-            self.file_created.emit("image", str(image_path))
+            self.file_created.emit("image", image_path)
             
-            return str(image_path)
+            return image_path
             
         except Exception as e:
             error_msg = f"Error saving captured image: {str(e)}"
-            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.logger.exception(error_msg)
             self.error_occurred.emit(error_msg)
             return None
     
@@ -292,32 +557,28 @@ class FileManager(QObject):
         """
         try:
             # Get target path
-            video_path = self.get_file_path("video", filename, hospital_name,
-                                          patient_name, patient_id)
-            
-            # Ensure directory exists
-            video_path.parent.mkdir(parents=True, exist_ok=True)
+            video_path = _fspath(self._video_path(filename, hospital_name,
+                                                 patient_name, patient_id))
             
             # Save the video
-            if isinstance(video_data, bytes):
-                with open(video_path, "wb") as f:
-                    f.write(video_data)
+            if isinstance(video_data, (bytes, bytearray, memoryview)):
+                _write_bytes(video_path, video_data)
             elif hasattr(video_data, 'read'):
                 # File-like object
                 with open(video_path, "wb") as f:
-                    shutil.copyfileobj(video_data, f)
+                    shutil.copyfileobj(video_data, f, _COPY_BUFSIZE)
             else:
-                # Assume it's a path to copy from
-                shutil.copy2(str(video_data), str(video_path))  # FIXED: STRING CONVERSION
+                # Assume it's a path to copy from (kernel-side copy where available)
+                shutil.copyfile(_fspath(video_data), video_path)
             
             self.logger.info(f"Saved captured video: {video_path}")
-            self.file_created.emit("video", str(video_path))
+            self.file_created.emit("video", video_path)
             
-            return str(video_path)
+            return video_path
             
         except Exception as e:
             error_msg = f"Error saving captured video: {str(e)}"
-            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.logger.exception(error_msg)
             self.error_occurred.emit(error_msg)
             return None
     
@@ -337,32 +598,28 @@ class FileManager(QObject):
         """
         try:
             # Get target path
-            report_path = self.get_file_path("report", filename, hospital_name,
-                                           patient_name, patient_id)
-            
-            # Ensure directory exists
-            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path = _fspath(self._report_path(filename, hospital_name,
+                                                   patient_name, patient_id))
             
             # Save the report
-            if isinstance(report_data, bytes):
-                with open(report_path, "wb") as f:
-                    f.write(report_data)
+            if isinstance(report_data, (bytes, bytearray, memoryview)):
+                _write_bytes(report_path, report_data)
             elif hasattr(report_data, 'read'):
                 # File-like object
                 with open(report_path, "wb") as f:
-                    shutil.copyfileobj(report_data, f)
+                    shutil.copyfileobj(report_data, f, _COPY_BUFSIZE)
             else:
-                # Assume it's a path to copy from
-                shutil.copy2(str(report_data), str(report_path))  # FIXED: STRING CONVERSION
+                # Assume it's a path to copy from (kernel-side copy where available)
+                shutil.copyfile(_fspath(report_data), report_path)
             
             self.logger.info(f"Saved report: {report_path}")
-            self.file_created.emit("report", str(report_path))
+            self.file_created.emit("report", report_path)
             
-            return str(report_path)
+            return report_path
             
         except Exception as e:
             error_msg = f"Error saving report: {str(e)}"
-            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.logger.exception(error_msg)
             self.error_occurred.emit(error_msg)
             return None
     
@@ -385,24 +642,24 @@ class FileManager(QObject):
                 raise FileNotFoundError(f"Source file not found: {source}")
             
             # Generate destination filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._ts()
             dest_filename = f"imported_{timestamp}_{source.name}"
             
             # Get destination path
-            dest_path = self.get_file_path("image", dest_filename, hospital_name,
-                                         patient_name, patient_id, use_timestamp=False)
+            dest_path = _fspath(self._image_path(dest_filename, hospital_name,
+                                                 patient_name, patient_id, use_timestamp=False))
             
-            # Copy the file
-            shutil.copy2(str(source), str(dest_path))  # FIXED: STRING CONVERSION
+            # Copy the file contents (kernel-side copy where available)
+            shutil.copyfile(_fspath(source_path), dest_path)
             
             self.logger.info(f"Imported image: {source} -> {dest_path}")
-            self.file_created.emit("image", str(dest_path))
+            self.file_created.emit("image", dest_path)
             
-            return str(dest_path)
+            return dest_path
             
         except Exception as e:
             error_msg = f"Error importing image: {str(e)}"
-            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.logger.exception(error_msg)
             self.error_occurred.emit(error_msg)
             return None
     
@@ -420,13 +677,14 @@ class FileManager(QObject):
         try:
             # Get source path as Path object
             source = Path(image_path)
-            if not source.exists():
-                raise FileNotFoundError(f"Source file not found: {source}")
+            try:
+                source_stat = os.stat(source)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Source file not found: {source}") from None
             
             # Determine destination
             if destination_hospital and destination_patient:
-                dest_path = self.get_file_path(
-                    "image", 
+                dest_path = self._image_path(
                     source.name,
                     destination_hospital,
                     destination_patient.get("name"),
@@ -436,26 +694,32 @@ class FileManager(QObject):
             else:
                 # Move to general images directory
                 dest_dir = self.base_dirs["data"] / "images" / "imported"
-                dest_dir.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(dest_dir)
                 dest_path = dest_dir / source.name
             
             # Handle filename collisions
-            if dest_path.exists():
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            try:
+                os.stat(dest_path)
+            except FileNotFoundError:
+                pass
+            else:
+                timestamp = self._ts()
                 name, ext = os.path.splitext(source.name)
                 dest_path = dest_path.parent / f"{name}_{timestamp}{ext}"
             
             # Move the file
-            shutil.move(str(source), str(dest_path))  # FIXED: STRING CONVERSION
+            source_str = _fspath(source)
+            dest_str = _fspath(dest_path)
+            self._move_file(source_str, dest_str, source_stat.st_dev)
             
-            self.logger.info(f"Moved image: {source} -> {dest_path}")
-            self.file_moved.emit("image", str(source), str(dest_path))
+            self.logger.info(f"Moved image: {source_str} -> {dest_str}")
+            self.file_moved.emit("image", source_str, dest_str)
             
-            return str(dest_path)
+            return dest_str
             
         except Exception as e:
             error_msg = f"Error moving image: {str(e)}"
-            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.logger.exception(error_msg)
             self.error_occurred.emit(error_msg)
             return None
     
@@ -470,34 +734,41 @@ class FileManager(QObject):
             True if successful, False otherwise
         """
         try:
-            # Get source path as Path object
+            # Get source path as Path object and as a string
             source = Path(image_path)
-            if not source.exists():
-                raise FileNotFoundError(f"File not found: {source}")
+            source_str = _fspath(source)
             
             if move_to_trash:
+                try:
+                    source_stat = os.stat(source_str)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"File not found: {source}") from None
+                
                 # Move to trash directory
                 trash_dir = self.base_dirs["data"] / "trash" / "images"
-                trash_dir.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(trash_dir)
                 
                 # Generate trash path
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = self._ts()
                 trash_path = trash_dir / f"{source.stem}_deleted_{timestamp}{source.suffix}"
                 
                 # Move to trash
-                shutil.move(str(source), str(trash_path))  # FIXED: STRING CONVERSION
-                self.logger.info(f"Moved image to trash: {source} -> {trash_path}")
+                self._move_file(source_str, _fspath(trash_path), source_stat.st_dev)
+                self.logger.info(f"Moved image to trash: {source_str} -> {trash_path}")
             else:
-                # Permanently delete
-                os.remove(str(source))  # FIXED: STRING CONVERSION
+                # Permanently delete (os.remove reports a missing file itself)
+                try:
+                    os.remove(source_str)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"File not found: {source}") from None
                 self.logger.info(f"Deleted image: {source}")
             
-            self.file_deleted.emit("image", str(source))
+            self.file_deleted.emit("image", source_str)
             return True
             
         except Exception as e:
             error_msg = f"Error deleting image: {str(e)}"
-            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.logger.exception(error_msg)
             self.error_occurred.emit(error_msg)
             return False
     
@@ -511,19 +782,12 @@ class FileManager(QObject):
             Number of files deleted
         """
         try:
-            temp_dir = self.base_dirs["temp"]
-            deleted_count = 0
+            temp_dir = _fspath(self.base_dirs["temp"])
             
-            # Calculate cutoff time
-            cutoff_time = datetime.now().timestamp() - (older_than_days * 86400)
+            # Calculate cutoff time in integer nanoseconds
+            cutoff_ns = time.time_ns() - older_than_days * 86400 * 1_000_000_000
             
-            for item in temp_dir.glob("**/*"):
-                if item.is_file():
-                    # Check file age
-                    file_time = item.stat().st_mtime
-                    if file_time < cutoff_time:
-                        os.remove(str(item))  # FIXED: STRING CONVERSION
-                        deleted_count += 1
+            deleted_count = _remove_files_older_than(temp_dir, cutoff_ns)
             
             self.logger.info(f"Cleaned up {deleted_count} temporary files")
             return deleted_count
@@ -544,55 +808,73 @@ class FileManager(QObject):
             Path to the backup archive
         """
         try:
+            import sqlite3
+            import tempfile
             import zipfile
             
             # Create backup directory
             backup_dir = self.base_dirs["backups"]
-            backup_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(backup_dir)
             
             # Generate backup filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._ts()
             backup_path = backup_dir / f"backup_{timestamp}.zip"
             
-            # Create zip file
-            with zipfile.ZipFile(str(backup_path), "w", zipfile.ZIP_DEFLATED) as zipf:  # FIXED: STRING CONVERSION
-                # Add database files
+            # Create zip file (fast deflate; compressed media is stored as-is)
+            with zipfile.ZipFile(_fspath(backup_path), "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+                # Add database files as online-backup snapshots: in WAL mode recent
+                # commits may exist only in the -wal file next to the live .db
                 db_dir = self.base_dirs["database"]
                 if db_dir.exists():
-                    for item in db_dir.glob("*.db"):
-                        zipf.write(str(item), f"database/{item.name}")  # FIXED: STRING CONVERSION
+                    with tempfile.TemporaryDirectory() as snapshot_dir:
+                        for item in db_dir.glob("*.db"):
+                            snapshot = os.path.join(snapshot_dir, item.name)
+                            source = sqlite3.connect(f"file:{item.as_posix()}?mode=ro", uri=True)
+                            destination = sqlite3.connect(snapshot)
+                            try:
+                                source.backup(destination)
+                            finally:
+                                source.close()
+                                destination.close()
+                            zipf.write(snapshot, f"database/{item.name}")
                 
                 # Add settings files
                 settings_dir = self.base_dirs["settings"]
                 if settings_dir.exists():
                     for item in settings_dir.glob("*.json"):
-                        zipf.write(str(item), f"settings/{item.name}")  # FIXED: STRING CONVERSION
+                        zipf.write(_fspath(item), f"settings/{item.name}")
                 
                 # Add hospital reports
-                hospitals_dir = self.base_dirs["hospitals"]
-                if hospitals_dir.exists():
-                    for hospital_dir in hospitals_dir.iterdir():
-                        if hospital_dir.is_dir():
-                            reports_dir = hospital_dir / "Reports"
-                            if reports_dir.exists():
-                                for report in reports_dir.glob("**/*.pdf"):
-                                    rel_path = report.relative_to(hospitals_dir)
-                                    zipf.write(str(report), f"hospitals/{rel_path}")  # FIXED: STRING CONVERSION
+                hospitals_dir = _fspath(self.base_dirs["hospitals"])
+                hospital_paths = []
+                if os.path.isdir(hospitals_dir):
+                    with os.scandir(hospitals_dir) as entries:
+                        hospital_paths = [entry.path for entry in entries if entry.is_dir()]
+                
+                # Collect reports (and media if requested) in one pass per hospital
+                hospital_files = []
+                for hospital_path in hospital_paths:
+                    for report in _iter_files(os.path.join(hospital_path, "Reports")):
+                        if report.name.endswith(".pdf"):
+                            hospital_files.append(report.path)
+                    if include_media:
+                        for media_file in _iter_files(os.path.join(hospital_path, "Media")):
+                            hospital_files.append(media_file.path)
                 
-                # Add media if requested
-                if include_media:
-                    if hospitals_dir.exists():
-                        for hospital_dir in hospitals_dir.iterdir():
-                            if hospital_dir.is_dir():
-                                media_dir = hospital_dir / "Media"
-                                if media_dir.exists():
-                                    for media_file in media_dir.glob("**/*"):
-                                        if media_file.is_file():
-                                            rel_path = media_file.relative_to(hospitals_dir)
-                                            zipf.write(str(media_file), f"hospitals/{rel_path}")  # FIXED: STRING CONVERSION
+                for file_path in hospital_files:
+                    arcname = f"hospitals/{os.path.relpath(file_path, hospitals_dir)}"
+                    ext = os.path.splitext(file_path)[1].lower()
+                    if ext in _STORED_EXTENSIONS:
+                        # Stream stored entries with a large buffer
+                        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                        with open(file_path, "rb") as src, zipf.open(zinfo, "w") as dst:
+                            shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+                    else:
+                        zipf.write(file_path, arcname)
             
             self.logger.info(f"Created backup: {backup_path}")
-            return str(backup_path)
+            return _fspath(backup_path)
             
         except Exception as e:
             error_msg = f"Error creating backup: {str(e)}"
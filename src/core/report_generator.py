@@ -1,18 +1,113 @@
 # COMPLETE REPORT_GENERATOR.PY - FIXED AND WORKING
 # FILE: src/core/report_generator.py
 
-from PySide6.QtCore import QObject, Signal, QDateTime
+from PySide6.QtCore import QObject, Signal, QDateTime, QRunnable, QThreadPool, Qt, QCoreApplication
 from PySide6.QtWidgets import QFileDialog, QProgressDialog, QMessageBox
 from PySide6.QtGui import QPainter, QPdfWriter, QPageLayout, QPageSize
 import logging
+import logging.handlers
 from pathlib import Path
 from datetime import datetime
 import traceback
+import functools
 import os
 import platform
+import shutil
+import subprocess
+
+_COPY_BUFSIZE = 1024 * 1024  # Read size for the portable export copy
+
+_generate_endoscopy_pdf = None
+
+
+def _pdf_func():
+    """Return generate_endoscopy_pdf, importing the PDF stack on first use
+    
+    Keeps fpdf/PIL out of application startup when no report is generated.
+    """
+    global _generate_endoscopy_pdf
+    if _generate_endoscopy_pdf is None:
+        # Import the PDF generation function from your utils/pdf_generator.py
+        from src.utils.pdf_generator import generate_endoscopy_pdf
+        _generate_endoscopy_pdf = generate_endoscopy_pdf
+    return _generate_endoscopy_pdf
+
+
+@functools.lru_cache(maxsize=1024)
+def _slug(name):
+    """Filename form of a patient name: spaces to underscores, lower case"""
+    return name.replace(" ", "_").lower()
+
+
+def _copy_file(source, destination):
+    """Copy file contents, in kernel space via os.sendfile where available
+    
+    Args:
+        source: Path of the file to copy
+        destination: Path to write
+    """
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        if hasattr(os, "sendfile"):
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                if remaining <= 0:
+                    return
+                # Short copy (file shrank?) - finish in user space
+                src.seek(offset)
+                dst.seek(offset)
+            except OSError:
+                # Filesystem does not support sendfile; restart in user space
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+
+class _PdfJobSignals(QObject):
+    """Signal carrier for _PdfJob (QRunnable cannot define signals)"""
+    
+    finished = Signal(str)  # Emits report path
+    failed = Signal(str)  # Emits error message
+
+
+class _PdfJob(QRunnable):
+    """Background job that renders one PDF on a QThreadPool thread"""
+    
+    def __init__(self, patient_data, findings, conclusions, recommendations,
+                 images_labels, filename):
+        """Initialize the job
+        
+        Args:
+            patient_data: Dictionary of patient information (already completed)
+            findings: Findings text
+            conclusions: Conclusions text
+            recommendations: Recommendations text
+            images_labels: Iterable of (image_path, label) tuples
+            filename: Output filename
+        """
+        super().__init__()
+        self.args = (patient_data, findings, conclusions, recommendations,
+                     images_labels, filename)
+        self.signals = _PdfJobSignals()
+    
+    def run(self):
+        """Render the PDF and report the outcome through self.signals"""
+        try:
+            pdf_path = _pdf_func()(*self.args)
+            if pdf_path:
+                self.signals.finished.emit(pdf_path)
+            else:
+                self.signals.failed.emit("PDF generator returned no file")
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
-# Import the PDF generation function from your utils/pdf_generator.py
-from src.utils.pdf_generator import generate_endoscopy_pdf
 
 class ReportGenerator(QObject):
     """PDF Report Generator for Endoscopy reporting system"""
@@ -31,6 +126,12 @@ class ReportGenerator(QObject):
         """
         super().__init__(parent)
         self.db = db_manager
+        self._active_jobs = set()  # Background PDF jobs kept alive until they report
+        self.fast_dialog = False  # Use Qt's own file dialog instead of the native one
+        self._batch_progress = None  # QProgressDialog of the running batch, if any
+        self._report_files = []  # (name, path) of every PDF under drafts/final
+        self._path_index_mtime = {}  # Directory -> st_mtime_ns when _report_files was built
+        self._path_index = {}  # Report ID -> newest matching Path (or None)
         self.setup_directories()
         self.configure_logging()
     
@@ -40,7 +141,10 @@ class ReportGenerator(QObject):
         self.reports_path.mkdir(parents=True, exist_ok=True)
         
         # Create dated subdirectories for better organization
-        current_date = datetime.now().strftime("%Y-%m")
+        now = datetime.now()
+        current_date = now.strftime("%Y-%m")
+        self._cached_month = current_date
+        self._cached_month_key = (now.year, now.month)
         self.current_reports_path = self.reports_path / current_date
         self.current_reports_path.mkdir(parents=True, exist_ok=True)
         
@@ -52,6 +156,22 @@ class ReportGenerator(QObject):
         for path in [self.draft_reports_path, self.final_reports_path, 
                      self.exported_reports_path]:
             path.mkdir(parents=True, exist_ok=True)
+        
+        # Directories known to exist, so per-report mkdir calls can be skipped
+        self._known_dirs = {self.reports_path, self.current_reports_path,
+                            self.draft_reports_path, self.final_reports_path,
+                            self.exported_reports_path}
+    
+    def _ensure_dir(self, path):
+        """Create a directory once and remember that it exists
+        
+        Args:
+            path: Directory path to create
+        """
+        if path in self._known_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(path)
     
     def configure_logging(self):
         """Setup logging for the report generator"""
@@ -61,11 +181,17 @@ class ReportGenerator(QObject):
             log_path = Path("data/logs/reports.log")
             log_path.parent.mkdir(parents=True, exist_ok=True)
             
-            file_handler = logging.FileHandler(log_path)
+            file_handler = logging.FileHandler(log_path, delay=True)
             formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
             file_handler.setFormatter(formatter)
             
-            self.logger.addHandler(file_handler)
+            # Buffer records so a batch of reports is written in a few large writes;
+            # errors flush immediately and logging.shutdown() flushes the rest at exit
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=256, flushLevel=logging.ERROR, target=file_handler
+            )
+            
+            self.logger.addHandler(buffered_handler)
             self.logger.setLevel(logging.INFO)
             
             self.logger.info("Report Generator initialized")
@@ -88,94 +214,231 @@ class ReportGenerator(QObject):
             # Track generation progress
             self.progress_updated.emit(10)
             
-            # Determine which report to generate
-            if not report_id and not patient_id:
-                raise ValueError("Either report_id or patient_id must be provided")
+            report_data, patient_data, images_data = self._fetch_report_data(report_id, patient_id)
             
-            report_data = None
-            if report_id and self.db:
-                report_data = self.db.get_report(report_id=report_id)
-            elif patient_id and self.db:
-                report_data = self.db.get_report(patient_id=patient_id)
+        except Exception as e:
+            error_msg = f"Report generation failed: {str(e)}"
+            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.generation_failed.emit(error_msg)
+            return None
+        
+        return self._generate_with_data(report_data, patient_data, images_data, custom_path, is_final)
+    
+    def _generate_with_data(self, report_data, patient_data, images_data,
+                            custom_path=None, is_final=False):
+        """Generate a PDF for a report whose data is already loaded
+        
+        Args:
+            report_data: Report row dictionary
+            patient_data: Patient row dictionary
+            images_data: List of (image_path, label) tuples
+            custom_path: Custom save path for the PDF (optional)
+            is_final: Whether this is a final report (default: False)
             
-            if not report_data:
-                raise ValueError(f"No report found for the provided ID")
+        Returns:
+            Path to the generated PDF report or None if failed
+        """
+        try:
+            pdf_args = self._build_report_pdf_args(
+                report_data, patient_data, images_data, custom_path, is_final
+            )
             
-            # Get actual report ID for further processing
-            report_id = report_data["report_id"]
-            patient_id = report_data["patient_id"]
+            self.progress_updated.emit(80)
             
-            self.progress_updated.emit(30)
+            # Generate the PDF
+            self.logger.info(f"Generating report for patient {report_data['patient_id']}")
+            pdf_path = _pdf_func()(*pdf_args)
             
-            # Get patient data
-            patient_data = None
-            if self.db:
-                patient_data = self.db.get_patient(patient_id)
+            self.progress_updated.emit(100)
+            self.logger.info(f"Report generated successfully: {pdf_path}")
             
-            if not patient_data:
-                raise ValueError(f"Patient not found: {patient_id}")
+            # Update database if this is a final report
+            if is_final and self.db:
+                self.db.update_report_status(report_data["report_id"], "final")
             
-            self.progress_updated.emit(50)
+            # Emit success signal
+            self.report_generated.emit(pdf_path)
+            self._index_report_file(pdf_path)
+            return pdf_path
             
-            # Get images for the report
-            images_data = []
-            if self.db:
-                images_data = self.db.get_report_images(report_id)
+        except Exception as e:
+            error_msg = f"Report generation failed: {str(e)}"
+            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.generation_failed.emit(error_msg)
+            return None
+    
+    def _fetch_report_data(self, report_id=None, patient_id=None):
+        """Load the report, its patient and its images from the database
+        
+        Args:
+            report_id: ID of the report (optional)
+            patient_id: ID of the patient if report_id not provided (optional)
             
-            self.progress_updated.emit(70)
+        Returns:
+            Tuple of (report_data, patient_data, images_data)
+        """
+        # Determine which report to generate
+        if not report_id and not patient_id:
+            raise ValueError("Either report_id or patient_id must be provided")
+        
+        if not self.db:
+            raise ValueError(f"No report found for the provided ID")
+        
+        # Resolve the patient's latest report first when only patient_id is given
+        if not report_id:
+            latest = self.db.get_report(patient_id=patient_id)
+            if not latest:
+                raise ValueError(f"No report found for the provided ID")
+            report_id = latest["report_id"]
+        
+        self.progress_updated.emit(30)
+        
+        bundle = self.db.get_report_bundle([report_id])
+        report_data = self._unpack_bundle(bundle, report_id)
+        
+        self.progress_updated.emit(70)
+        
+        return report_data
+    
+    def _unpack_bundle(self, bundle, report_id):
+        """Pick one report's data out of a get_report_bundle result
+        
+        Args:
+            bundle: Dictionary returned by DatabaseManager.get_report_bundle
+            report_id: ID of the report to extract
             
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            if custom_path:
-                filename = Path(custom_path)
-            else:
-                # Determine appropriate directory
-                current_date = datetime.now().strftime("%Y-%m")
-                base_dir = self.final_reports_path if is_final else self.draft_reports_path
-                patient_name = patient_data.get("name", "").replace(" ", "_").lower()
-                
-                filename = base_dir / current_date / f"report_{patient_id}_{patient_name}_{timestamp}.pdf"
-                filename.parent.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Tuple of (report_data, patient_data, images_data)
+        """
+        if report_id not in bundle:
+            raise ValueError(f"No report found for the provided ID")
+        
+        report_data, patient_data, images_data = bundle[report_id]
+        if not patient_data:
+            raise ValueError(f"Patient not found: {report_data['patient_id']}")
+        
+        return report_data, patient_data, images_data
+    
+    def _build_report_pdf_args(self, report_data, patient_data, images_data,
+                               custom_path=None, is_final=False, report_dir=None):
+        """Build the generate_endoscopy_pdf arguments for a database report
+        
+        Args:
+            report_data: Report row dictionary
+            patient_data: Patient row dictionary
+            images_data: List of (image_path, label) tuples
+            custom_path: Custom save path for the PDF (optional)
+            is_final: Whether this is a final report
+            report_dir: Precomputed, existing output directory (optional, for batches)
             
-            # Prepare data for the PDF generation
-            findings = report_data.get("findings", "")
-            conclusions = report_data.get("conclusions", "")
-            recommendations = report_data.get("recommendations", "")
+        Returns:
+            Tuple of positional arguments for generate_endoscopy_pdf
+        """
+        patient_id = report_data["patient_id"]
+        
+        # One clock read for timestamp, month directory and report date
+        now = datetime.now()
+        
+        # Generate filename
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        if custom_path:
+            filename = Path(custom_path)
+        else:
+            if report_dir is None:
+                report_dir = self._report_dir(is_final, now)
+            patient_name = _slug(patient_data.get("name", ""))
+            filename = self._build_report_filename(report_dir, patient_id, patient_name, timestamp)
+        
+        # Prepare data for the PDF generation
+        findings = report_data.get("findings", "")
+        conclusions = report_data.get("conclusions", "")
+        recommendations = report_data.get("recommendations", "")
+        
+        # Add derived fields to patient data, formatting doctor and designation if needed
+        has_signature = "doctor" in patient_data and "designation" in patient_data
+        complete_patient_data = {
+            **patient_data,
+            "report_title": report_data.get("report_title", "ENDOSCOPY REPORT"),
+            "indication": report_data.get("indication", ""),
+            "Date": now.strftime("%d/%m/%Y"),
+            **({"Doctor": patient_data["doctor"].upper(),
+                "Designation": patient_data["designation"].upper()} if has_signature else {}),
+        }
+        
+        return (complete_patient_data, findings, conclusions, recommendations,
+                images_data, str(filename))
+    
+    def _report_dir(self, is_final, now):
+        """Return (and create once) the month directory for draft or final reports
+        
+        Args:
+            is_final: Whether the report is final
+            now: datetime of the current report
             
-            # Add derived fields to patient data
-            complete_patient_data = {**patient_data}
-            complete_patient_data["report_title"] = report_data.get("report_title", "ENDOSCOPY REPORT")
-            complete_patient_data["indication"] = report_data.get("indication", "")
-            complete_patient_data["Date"] = datetime.now().strftime("%d/%m/%Y")
+        Returns:
+            Path of the output directory
+        """
+        # Determine appropriate directory
+        base_dir = self.final_reports_path if is_final else self.draft_reports_path
+        report_dir = base_dir / self._month_dir_name(now)
+        self._ensure_dir(report_dir)
+        return report_dir
+    
+    def _build_report_filename(self, base_dir, patient_id, patient_name, timestamp):
+        """Build the report PDF path inside an existing directory
+        
+        Args:
+            base_dir: Output directory
+            patient_id: Patient ID
+            patient_name: Patient name slug
+            timestamp: YYYYmmdd_HHMMSS string
             
-            # Format doctor and designation if needed
-            if "doctor" in patient_data and "designation" in patient_data:
-                complete_patient_data["Doctor"] = patient_data["doctor"].upper()
-                complete_patient_data["Designation"] = patient_data["designation"].upper()
+        Returns:
+            Path of the PDF file
+        """
+        return Path(os.path.join(base_dir, f"report_{patient_id}_{patient_name}_{timestamp}.pdf"))
+    
+    def _month_dir_name(self, now):
+        """Return the YYYY-mm directory name for now, reusing the cached one
+        
+        Args:
+            now: datetime of the current report
             
-            self.progress_updated.emit(80)
+        Returns:
+            Month directory name string
+        """
+        month_key = (now.year, now.month)
+        if month_key != self._cached_month_key:
+            self._cached_month = now.strftime("%Y-%m")
+            self._cached_month_key = month_key
+        return self._cached_month
+    
+    def generate_report_async(self, report_id=None, patient_id=None, custom_path=None, is_final=False):
+        """Generate a PDF report from database on a background thread
+        
+        Data is fetched on the calling thread; only the PDF rendering runs
+        on QThreadPool.globalInstance(). The outcome is reported through
+        report_generated / generation_failed.
+        
+        Args:
+            report_id: ID of the report to generate (optional)
+            patient_id: ID of the patient if report_id not provided (optional)
+            custom_path: Custom save path for the PDF (optional)
+            is_final: Whether this is a final report (default: False)
             
-            # Generate the PDF
-            self.logger.info(f"Generating report for patient {patient_id}")
-            pdf_path = generate_endoscopy_pdf(
-                complete_patient_data,
-                findings,
-                conclusions,
-                recommendations,
-                images_data,
-                str(filename)
+        Returns:
+            The submitted job, or None if the data could not be prepared
+        """
+        try:
+            self.progress_updated.emit(10)
+            report_data, patient_data, images_data = self._fetch_report_data(report_id, patient_id)
+            pdf_args = self._build_report_pdf_args(
+                report_data, patient_data, images_data, custom_path, is_final
             )
+            self.progress_updated.emit(80)
             
-            self.progress_updated.emit(100)
-            self.logger.info(f"Report generated successfully: {pdf_path}")
-            
-            # Update database if this is a final report
-            if is_final and self.db:
-                self.db.update_report_status(report_id, "final")
-            
-            # Emit success signal
-            self.report_generated.emit(pdf_path)
-            return pdf_path
+            final_report_id = report_data["report_id"] if is_final else None
+            return self._start_pdf_job(pdf_args, final_report_id)
             
         except Exception as e:
             error_msg = f"Report generation failed: {str(e)}"
@@ -183,6 +446,48 @@ class ReportGenerator(QObject):
             self.generation_failed.emit(error_msg)
             return None
     
+    def _start_pdf_job(self, pdf_args, final_report_id=None, pool=None, on_done=None):
+        """Submit a PDF rendering job to a thread pool
+        
+        Args:
+            pdf_args: Positional arguments for generate_endoscopy_pdf
+            final_report_id: Report to mark final once rendered (optional)
+            pool: QThreadPool to use (default: global instance)
+            on_done: Callable receiving the PDF path, or None on failure (optional)
+            
+        Returns:
+            The submitted _PdfJob
+        """
+        _pdf_func()  # Import on this thread rather than inside a worker
+        job = _PdfJob(*pdf_args)
+        self._active_jobs.add(job)
+        
+        def on_finished(pdf_path):
+            self._active_jobs.discard(job)
+            if pool is None:
+                self.progress_updated.emit(100)  # Batches report their own overall progress
+            self.logger.info(f"Report generated successfully: {pdf_path}")
+            if final_report_id and self.db:
+                self.db.update_report_status(final_report_id, "final")
+            self.report_generated.emit(pdf_path)
+            self._index_report_file(pdf_path)
+            if on_done:
+                on_done(pdf_path)
+        
+        def on_failed(message):
+            self._active_jobs.discard(job)
+            error_msg = f"Report generation failed: {message}"
+            self.logger.error(error_msg)
+            self.generation_failed.emit(error_msg)
+            if on_done:
+                on_done(None)
+        
+        # Signals are emitted from the worker thread and queued to this thread
+        job.signals.finished.connect(on_finished, Qt.QueuedConnection)
+        job.signals.failed.connect(on_failed, Qt.QueuedConnection)
+        (pool or QThreadPool.globalInstance()).start(job)
+        return job
+    
     def generate_pdf_from_data(self, patient_data, findings, conclusions, recommendations, 
                               images_labels, filename):
         """Generate PDF directly from provided data without database access - FIXED
@@ -192,7 +497,7 @@ class ReportGenerator(QObject):
             findings: Findings text
             conclusions: Conclusions text
             recommendations: Recommendations text
-            images_labels: List of (image_path, label) tuples
+            images_labels: Iterable of (image_path, label) tuples
             filename: Output filename
             
         Returns:
@@ -205,40 +510,22 @@ class ReportGenerator(QObject):
             
             # Create directory if needed
             filepath = Path(filename)
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(filepath.parent)
             
             # Prepare patient data with any additional fields
-            complete_patient_data = dict(patient_data)
-            
-            # ENSURE REPORT_TITLE AND INDICATION ARE PROPERLY SET
-            if "report_title" not in complete_patient_data:
-                complete_patient_data["report_title"] = "ENDOSCOPY REPORT"
-            
-            if "indication" not in complete_patient_data:
-                complete_patient_data["indication"] = ""
-            
-            if "Date" not in complete_patient_data:
-                complete_patient_data["Date"] = datetime.now().strftime("%d/%m/%Y")
-            
-            # Format doctor and designation if needed
-            if "doctor" in patient_data:
-                complete_patient_data["Doctor"] = patient_data["doctor"].upper()
-            
-            if "designation" in patient_data:
-                complete_patient_data["Designation"] = patient_data["designation"].upper()
+            complete_patient_data = self._complete_patient_data(patient_data)
             
             # LOG THE DATA BEING PASSED TO PDF GENERATOR
-            self.logger.info(f"Generating PDF to: {filepath}")
-            self.logger.info(f"Patient data keys: {list(complete_patient_data.keys())}")
-            self.logger.info(f"Report title: {complete_patient_data.get('report_title')}")
-            self.logger.info(f"Indication: {complete_patient_data.get('indication')}")
-            self.logger.info(f"Findings length: {len(findings) if findings else 0}")
-            self.logger.info(f"Images count: {len(images_labels) if images_labels else 0}")
-            
-            # IMPORT AND USE THE CORRECT PDF GENERATOR FUNCTION
-            from src.utils.pdf_generator import generate_endoscopy_pdf
+            from src.utils.pdf_generator import image_count_label  # Loaded by _pdf_func() next anyway
+            self.logger.info(
+                "Generating PDF to: %s (keys=%s, title=%s, indication=%s, findings_len=%d, images=%s)",
+                filepath, list(complete_patient_data), complete_patient_data.get("report_title"),
+                complete_patient_data.get("indication"),
+                len(findings) if findings else 0,
+                image_count_label(images_labels)
+            )
             
-            pdf_path = generate_endoscopy_pdf(
+            pdf_path = _pdf_func()(
                 complete_patient_data,
                 findings,
                 conclusions,
@@ -249,6 +536,7 @@ class ReportGenerator(QObject):
             
             self.logger.info(f"PDF generated successfully: {pdf_path}")
             self.report_generated.emit(pdf_path)
+            self._index_report_file(pdf_path)
             
             return pdf_path
             
@@ -258,6 +546,54 @@ class ReportGenerator(QObject):
             self.generation_failed.emit(f"Failed to generate PDF: {str(e)}")
             return None
     
+    def generate_pdf_from_data_async(self, patient_data, findings, conclusions, recommendations,
+                                     images_labels, filename):
+        """Generate PDF from provided data on a background thread
+        
+        Same inputs as generate_pdf_from_data; the outcome is reported through
+        report_generated / generation_failed instead of a return value.
+        
+        Returns:
+            The submitted job, or None if the data was invalid
+        """
+        try:
+            if not patient_data:
+                raise ValueError("Patient data is required")
+            
+            filepath = Path(filename)
+            self._ensure_dir(filepath.parent)
+            
+            pdf_args = (self._complete_patient_data(patient_data), findings, conclusions,
+                        recommendations, images_labels, str(filepath))
+            self.logger.info(f"Generating PDF in background to: {filepath}")
+            return self._start_pdf_job(pdf_args)
+            
+        except Exception as e:
+            error_msg = f"Failed to generate PDF from data: {str(e)}"
+            self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            self.generation_failed.emit(f"Failed to generate PDF: {str(e)}")
+            return None
+    
+    def _complete_patient_data(self, patient_data):
+        """Return a copy of patient_data with the fields the PDF layout expects
+        
+        Args:
+            patient_data: Dictionary of patient information
+            
+        Returns:
+            New dictionary with report_title, indication, Date, Doctor and Designation set
+        """
+        # ENSURE REPORT_TITLE, INDICATION AND DATE ARE PROPERLY SET (caller values win)
+        # and format doctor and designation if needed
+        return {
+            "report_title": "ENDOSCOPY REPORT",
+            "indication": "",
+            **patient_data,
+            **({} if "Date" in patient_data else {"Date": datetime.now().strftime("%d/%m/%Y")}),
+            **({"Doctor": patient_data["doctor"].upper()} if "doctor" in patient_data else {}),
+            **({"Designation": patient_data["designation"].upper()} if "designation" in patient_data else {}),
+        }
+    
     def save_report_dialog(self, report_id=None, patient_id=None, patient_data=None, 
                           report_data=None, images=None):
         """Show save dialog and generate report with custom path
@@ -282,35 +618,29 @@ class ReportGenerator(QObject):
             if not using_database and not using_direct_data:
                 raise ValueError("Either database IDs or direct data must be provided")
             
+            # Load database data once; it is reused for the generation below
+            if using_database:
+                report_data, patient_data, images = self._fetch_report_data(report_id, patient_id)
+            
             # Get patient name for default filename
             patient_name = "report"
-            if using_database:
-                # Get patient info from database
-                if patient_id is None and report_id is not None:
-                    report_data_db = self.db.get_report(report_id=report_id)
-                    if report_data_db:
-                        patient_id = report_data_db["patient_id"]
-                
-                if patient_id:
-                    patient_data_db = self.db.get_patient(patient_id)
-                    if patient_data_db and "name" in patient_data_db:
-                        patient_name = patient_data_db["name"].replace(" ", "_").lower()
-            elif using_direct_data:
-                # Get patient name from provided data
-                if "name" in patient_data:
-                    patient_name = patient_data["name"].replace(" ", "_").lower()
+            if patient_data.get("name"):
+                patient_name = _slug(patient_data["name"])
             
             # Create default filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             default_filename = f"{patient_name}_{timestamp}.pdf"
             
             # Show save dialog
-            file_path, _ = QFileDialog.getSaveFileName(
+            dialog_args = [
                 None,
                 "Save Endoscopy Report",
                 str(self.exported_reports_path / default_filename),
                 "PDF Files (*.pdf)"
-            )
+            ]
+            if self.fast_dialog:
+                dialog_args += ["", QFileDialog.DontUseNativeDialog]
+            file_path, _ = QFileDialog.getSaveFileName(*dialog_args)
             
             if not file_path:
                 # User cancelled
@@ -326,24 +656,25 @@ class ReportGenerator(QObject):
             
             # Generate report with custom path
             result = None
-            if using_database:
-                result = self.generate_report(report_id, patient_id, file_path)
-            elif using_direct_data:
-                # Show intermediate progress
-                progress.setValue(50)
-                
-                result = self.generate_pdf_from_data(
-                    patient_data,
-                    report_data.get("findings", ""),
-                    report_data.get("conclusions", ""),
-                    report_data.get("recommendations", ""),
-                    images or [],
-                    file_path
-                )
-            
-            # Disconnect signal and close dialog
-            self.progress_updated.disconnect(progress.setValue)
-            progress.close()
+            try:
+                if using_database:
+                    result = self._generate_with_data(report_data, patient_data, images, file_path)
+                elif using_direct_data:
+                    # Show intermediate progress
+                    progress.setValue(50)
+                    
+                    result = self.generate_pdf_from_data(
+                        patient_data,
+                        report_data.get("findings", ""),
+                        report_data.get("conclusions", ""),
+                        report_data.get("recommendations", ""),
+                        images or [],
+                        file_path
+                    )
+            finally:
+                # Disconnect signal and close dialog, even if generation raised
+                self.progress_updated.disconnect(progress.setValue)
+                progress.close()
             
             return result
             
@@ -353,11 +684,13 @@ class ReportGenerator(QObject):
             QMessageBox.critical(None, "Report Generation Error", error_msg)
             return None
     
-    def batch_generate_reports(self, report_ids):
+    def batch_generate_reports(self, report_ids, quiet=False):
         """Generate multiple reports in batch
         
         Args:
             report_ids: List of report IDs to generate
+            quiet: Skip the progress dialog and message boxes; overall progress
+                is emitted through progress_updated instead (default: False)
             
         Returns:
             List of (report_id, pdf_path) tuples for successful generations
@@ -367,45 +700,80 @@ class ReportGenerator(QObject):
                 raise ValueError("Database manager is required for batch report generation")
                 
             results = []
+            total = len(report_ids)
             
             # Show progress dialog
-            progress = QProgressDialog("Generating reports...", "Cancel", 0, len(report_ids) * 100)
-            progress.setWindowTitle("Batch PDF Generation")
-            progress.setMinimumDuration(500)  # Show after 500ms delay
-            
-            # Process each report
-            for i, report_id in enumerate(report_ids):
-                if progress.wasCanceled():
+            progress = None
+            if not quiet:
+                progress = QProgressDialog("Generating reports...", "Cancel", 0, total * 100)
+                progress.setWindowTitle("Batch PDF Generation")
+                progress.setMinimumDuration(500)  # Show after 500ms delay
+            
+            # Fetch everything on this thread first; workers never touch SQLite
+            bundle = self.db.get_report_bundle(report_ids)
+            report_dir = self._report_dir(False, datetime.now())  # Shared by the whole batch
+            used_names = set()
+            prepared = []
+            for report_id in report_ids:
+                try:
+                    report_data, patient_data, images_data = self._unpack_bundle(bundle, report_id)
+                    pdf_args = self._build_report_pdf_args(
+                        report_data, patient_data, images_data, report_dir=report_dir
+                    )
+                    
+                    # Same patient within the same second would share a filename
+                    filename = pdf_args[-1]
+                    if filename in used_names:
+                        stem = filename[:-len(".pdf")]
+                        filename = next(f"{stem}_{n}.pdf" for n in range(2, len(used_names) + 2)
+                                        if f"{stem}_{n}.pdf" not in used_names)
+                        pdf_args = pdf_args[:-1] + (filename,)
+                    used_names.add(filename)
+                    prepared.append((report_id, pdf_args))
+                except Exception as e:
+                    error_msg = f"Report generation failed: {str(e)}"
+                    self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
+                    self.generation_failed.emit(error_msg)
+            
+            # Render in parallel, one job per report
+            pool = QThreadPool()
+            pool.setMaxThreadCount(max(1, min(len(prepared), os.cpu_count() or 1)))
+            jobs = []
+            
+            # Batch state read by the persistent _on_batch_job_done slot
+            self._batch_progress = progress
+            self._batch_total = total
+            self._batch_completed = total - len(prepared)
+            self._batch_results = results
+            
+            for report_id, pdf_args in prepared:
+                on_done = functools.partial(self._on_batch_job_done, report_id)
+                jobs.append(self._start_pdf_job(pdf_args, pool=pool, on_done=on_done))
+            
+            # Wait for the workers while delivering their queued signals
+            while self._batch_completed < total:
+                if progress is not None and progress.wasCanceled():
+                    pool.clear()  # Drop jobs that have not started yet
+                    pool.waitForDone()
                     break
-                
-                # Update main progress
-                progress.setLabelText(f"Generating report {i+1} of {len(report_ids)}...")
-                
-                # Define a translator function to map individual report progress to overall
-                base_progress = i * 100
-                def update_batch_progress(value):
-                    overall_progress = base_progress + value
-                    progress.setValue(min(overall_progress, len(report_ids) * 100))
-                
-                # Connect temporary signal translator
-                self.progress_updated.connect(update_batch_progress)
-                
-                # Generate the report
-                pdf_path = self.generate_report(report_id=report_id)
-                
-                # Disconnect translator
-                self.progress_updated.disconnect(update_batch_progress)
-                
-                if pdf_path:
-                    results.append((report_id, pdf_path))
+                pool.waitForDone(50)
+                QCoreApplication.processEvents()
+            QCoreApplication.processEvents()
+            self._active_jobs.difference_update(jobs)  # Cancelled jobs never report back
+            self._batch_progress = None
+            
+            # Keep the caller's order rather than completion order
+            order = {report_id: i for i, report_id in enumerate(report_ids)}
+            results.sort(key=lambda item: order[item[0]])
             
-            progress.close()
+            if progress is not None:
+                progress.close()
             
             # Show completion message
             success_count = len(results)
             total_count = len(report_ids)
             
-            if success_count > 0:
+            if success_count > 0 and not quiet:
                 QMessageBox.information(
                     None,
                     "Batch Generation Complete",
@@ -417,9 +785,31 @@ class ReportGenerator(QObject):
         except Exception as e:
             error_msg = f"Batch report generation failed: {str(e)}"
             self.logger.error(f"{error_msg}\n{traceback.format_exc()}")
-            QMessageBox.critical(None, "Batch Generation Error", error_msg)
+            if quiet:
+                self.generation_failed.emit(error_msg)
+            else:
+                QMessageBox.critical(None, "Batch Generation Error", error_msg)
             return []
     
+    def _on_batch_job_done(self, report_id, pdf_path):
+        """Record one finished batch job and advance the batch progress
+        
+        Args:
+            report_id: ID of the report the job rendered
+            pdf_path: Path of the generated PDF, or None if it failed
+        """
+        self._batch_completed += 1
+        if pdf_path:
+            self._batch_results.append((report_id, pdf_path))
+        
+        if self._batch_progress is None:
+            self.progress_updated.emit(self._batch_completed * 100 // self._batch_total)
+        else:
+            self._batch_progress.setLabelText(
+                f"Generated {self._batch_completed} of {self._batch_total} reports..."
+            )
+            self._batch_progress.setValue(self._batch_completed * 100)
+    
     # HELPER METHODS
     
     def get_report_path(self, report_id):
@@ -431,21 +821,88 @@ class ReportGenerator(QObject):
         Returns:
             Path object for the expected report location or None if not found
         """
-        # Find newest report for this ID
+        if not self._report_index_fresh():
+            self._scan_report_dirs()
+        
+        key = str(report_id)
+        if key not in self._path_index:
+            # Newest PDF whose name contains this ID; only matches are stat-ed
+            stamped = []
+            for name, path in self._report_files:
+                if key in name:
+                    try:
+                        stamped.append((os.stat(path).st_mtime, path))
+                    except OSError:
+                        continue  # Deleted since the last scan
+            
+            # Single O(n) pass - only the newest is needed, so no sort
+            newest = max(stamped, default=None)
+            self._path_index[key] = Path(newest[1]) if newest else None
+        
+        return self._path_index[key]
+    
+    def _report_index_fresh(self):
+        """Check whether no report directory changed since the last scan"""
+        if not self._path_index_mtime:
+            return False
+        try:
+            for directory, mtime_ns in self._path_index_mtime.items():
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return False
+        except OSError:
+            return False
+        return True
+    
+    def _scan_report_dirs(self):
+        """Rebuild the PDF index with a single os.scandir walk of drafts/final"""
         report_files = []
+        dir_mtimes = {}
+        pending = [str(self.draft_reports_path.absolute()), str(self.final_reports_path.absolute())]
+        
+        while pending:
+            directory = pending.pop()
+            try:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".pdf"):
+                            report_files.append((entry.name, entry.path))
+            except OSError:
+                continue
+        
+        self._report_files = report_files
+        self._path_index_mtime = dir_mtimes
+        self._path_index = {}
+    
+    def _index_report_file(self, pdf_path):
+        """Add a freshly written PDF to the index so lookups need no rescan
         
-        # Search in both draft and final directories
-        for base_dir in [self.draft_reports_path, self.final_reports_path]:
-            for path in base_dir.glob(f"**/*{report_id}*.pdf"):
-                report_files.append(path)
+        Args:
+            pdf_path: Path of the generated PDF
+        """
+        if not pdf_path or not self._path_index_mtime:
+            return
         
-        # Sort by modification time (newest first)
-        report_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        path = Path(pdf_path).absolute()
+        roots = (self.draft_reports_path.absolute(), self.final_reports_path.absolute())
+        root = next((r for r in roots if r in path.parents), None)
+        if root is None:
+            return
         
-        if report_files:
-            return report_files[0]
+        try:
+            self._report_files.append((path.name, str(path)))
+            
+            # Re-stamp the directories between the file and its root
+            for directory in path.parents:
+                self._path_index_mtime[str(directory)] = os.stat(directory).st_mtime_ns
+                if directory == root:
+                    break
+        except OSError:
+            self._path_index_mtime = {}  # Force a rescan on next lookup
         
-        return None
+        self._path_index = {}
     
     def open_report(self, pdf_path):
         """Open a report with the default PDF viewer
@@ -466,10 +923,15 @@ class ReportGenerator(QObject):
             
             if system == "Windows":
                 os.startfile(str(pdf_path))
-            elif system == "Darwin":  # macOS
-                os.system(f"open '{pdf_path}'")
-            else:  # Linux
-                os.system(f"xdg-open '{pdf_path}'")
+            else:
+                # No shell: returns as soon as the viewer is spawned, any path is safe
+                opener = "open" if system == "Darwin" else "xdg-open"  # macOS / Linux
+                subprocess.Popen(
+                    [opener, str(pdf_path)],
+                    close_fds=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
             
             self.logger.info(f"Opened PDF: {pdf_path}")
             return True
@@ -504,6 +966,8 @@ class ReportGenerator(QObject):
             file_dialog = QFileDialog(None)
             file_dialog.setAcceptMode(QFileDialog.AcceptSave)
             file_dialog.setNameFilter("PDF Files (*.pdf)")
+            if self.fast_dialog:
+                file_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
             
             # Suggest filename based on original
             export_name = f"export_{report_path.stem}.pdf"
@@ -517,8 +981,7 @@ class ReportGenerator(QObject):
                 export_path += ".pdf"
             
             # Copy the file to export location
-            import shutil
-            shutil.copy2(report_path, export_path)
+            _copy_file(report_path, export_path)
             
             self.logger.info(f"Exported report to: {export_path}")
             return export_path
@@ -0,0 +1,772 @@
+# SEARCH DIALOGS (imported lazily by SearchManager)
+from PySide6.QtCore import (
+    QObject, Signal, Qt, QDate, QAbstractTableModel, QModelIndex,
+    QRunnable, QThreadPool, QTimer
+)
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, 
+    QLabel, QLineEdit, QComboBox, QDateEdit, QPushButton,
+    QTableWidget, QTableWidgetItem, QTableView, QHeaderView, QMessageBox,
+    QCheckBox, QGroupBox, QAbstractItemView
+)
+from datetime import datetime
+
+from src.core.search_manager import PatientCriteria, ReportCriteria
+
+
+def _format_db_date(date_str):
+    """Format a database timestamp for display, returning it unchanged if unparseable
+    
+    Args:
+        date_str: "%Y-%m-%d %H:%M:%S" timestamp string
+        
+    Returns:
+        "%d/%m/%Y %H:%M" string
+    """
+    if not date_str:
+        return ""
+    # Fixed-width database format: slice instead of strptime/strftime per row
+    if (len(date_str) >= 16 and date_str[4] == "-" and date_str[7] == "-"
+            and date_str[10] == " " and date_str[13] == ":"):
+        return f"{date_str[8:10]}/{date_str[5:7]}/{date_str[0:4]} {date_str[11:16]}"
+    try:
+        date_obj = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        return date_obj.strftime("%d/%m/%Y %H:%M")
+    except Exception:
+        return date_str
+
+
+class PatientResultsModel(QAbstractTableModel):
+    """Table model for patient search results, streamed a page at a time as the view scrolls"""
+    
+    HEADERS = ["Patient ID", "Hospital", "Name", "Gender", "Age", "Doctor", "Date"]
+    SORT_KEYS = ["patient_id", "hospital", "name", "gender", "age", "doctor", "visit_date"]
+    PAGE_SIZE = 200
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model
+        
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._rows = []
+        self._stream = None
+        self._total = 0
+        self._reopen = None
+    
+    def reset_rows(self, rows, stream=None, total=None, reopen=None):
+        """Replace the results, closing any previous stream
+        
+        Args:
+            rows: First rows (patient dictionaries)
+            stream: PagedResult holding the rows after these (optional)
+            total: Total number of matching rows when more can be fetched (optional)
+            reopen: Callable(sort_key, descending) returning a PagedResult of the same
+                matches in that order, used to sort in SQL (optional)
+        """
+        self.beginResetModel()
+        self.close_stream()
+        self._rows = list(rows)
+        self._stream = stream
+        self._total = total if total is not None else len(self._rows)
+        self._reopen = reopen
+        self.endResetModel()
+    
+    def close_stream(self):
+        """Stop streaming further rows and release the database cursor"""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+    
+    def total_count(self):
+        """Return the number of matching rows, loaded or not"""
+        return self._total
+    
+    def patient_id(self, row):
+        """Return the patient ID of a row, or "" if out of range"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row].get("patient_id", "") or ""
+        return ""
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._display_text(self._rows[index.row()], index.column())
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return (not parent.isValid() and self._stream is not None
+                and not self._stream.exhausted)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        start = len(self._rows)
+        page = self._stream.fetch(self.PAGE_SIZE)
+        if self._stream.exhausted:
+            self._stream = None
+        if page:
+            self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+        # The count ran separately; trust the rows actually read once they run out
+        if self._stream is None:
+            self._total = len(self._rows)
+        else:
+            self._total = max(self._total, len(self._rows))
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column < 0:
+            return
+        if self._reopen is not None:
+            # Let SQLite order the matches and stream them again from the top
+            stream = self._reopen(self.SORT_KEYS[column], order == Qt.DescendingOrder)
+            rows = stream.fetch(self.PAGE_SIZE)
+            total = len(rows) if stream.exhausted else max(self._total, len(rows))
+            self.reset_rows(rows, stream, total, self._reopen)
+            return
+        # In-memory results (the limited recent list) are sorted in place;
+        # finish loading first
+        while self.canFetchMore():
+            self.fetchMore()
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(
+            key=lambda patient: self._display_text(patient, column),
+            reverse=order == Qt.DescendingOrder
+        )
+        self.layoutChanged.emit()
+    
+    @staticmethod
+    def _display_text(patient, column):
+        """Cell text for a patient row, computed only when the view asks for it"""
+        if column == 0:
+            return patient.get("patient_id", "")
+        if column == 1:
+            return patient.get("hospital_name", "")
+        if column == 2:
+            return patient.get("name", "")
+        if column == 3:
+            return patient.get("gender", "")
+        if column == 4:
+            return str(patient.get("age", ""))
+        if column == 5:
+            return patient.get("doctor", "")
+        # Format date for display
+        return _format_db_date(patient.get("visit_date") or patient.get("date_created", ""))
+
+
+class _SearchSignals(QObject):
+    """Signal carrier for SearchWorker (QRunnable cannot define signals)"""
+    
+    finished = Signal(list, object, int)  # Emits first page of rows, PagedResult for the rest, total match count
+    failed = Signal(str)  # Emits error message
+
+
+class SearchWorker(QRunnable):
+    """Runs a streamed patient search off the GUI thread"""
+    
+    def __init__(self, db_manager, criteria, page_size):
+        """Initialize the worker
+        
+        Args:
+            db_manager: DatabaseManager instance (opens its own connection per call)
+            criteria: Dictionary of search criteria
+            page_size: Number of rows to load up front
+        """
+        super().__init__()
+        self.db = db_manager
+        self.criteria = criteria
+        self.page_size = page_size
+        self.cancelled = False  # Set from the GUI thread when a newer search supersedes this one
+        self.signals = _SearchSignals()
+    
+    def run(self):
+        """Count, open the result stream and read the first page, unless cancelled in the meantime"""
+        try:
+            if self.cancelled:
+                return
+            total = self.db.count_patients(self.criteria)
+            if self.cancelled:
+                return
+            stream = self.db.stream_patients(self.criteria)
+            rows = stream.fetch(self.page_size)
+            if self.cancelled:
+                stream.close()
+                return
+            self.signals.finished.emit(rows, stream, total)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(str(e))
+
+
+class PatientSearchDialog(QDialog):
+    """Dialog for searching and selecting patients"""
+    
+    def __init__(self, search_manager, parent=None, recent_limit=200, preloaded_recent=None):
+        """Initialize the patient search dialog
+        
+        Args:
+            search_manager: SearchManager instance (cached searches; its db streams paged results)
+            parent: Parent widget
+            recent_limit: Maximum recent patients to list (0 = no limit)
+            preloaded_recent: Recent patient records already fetched by the caller
+        """
+        super().__init__(parent)
+        self.search = search_manager
+        self.db = search_manager.db
+        self.selected_patient_id = None
+        self.recent_limit = recent_limit
+        # Default date range, shared by setup_ui and clear_search
+        self._today = QDate.currentDate()
+        self._month_ago = self._today.addMonths(-1)
+        self._search_worker = None
+        self.setup_ui()
+        if preloaded_recent is not None:
+            self.populate_results(preloaded_recent, context="recent", limited=True)
+        else:
+            self.load_recent_patients()
+    
+    def setup_ui(self):
+        """Setup the dialog UI"""
+        self.setWindowTitle("Patient Search")
+        self.setMinimumWidth(900)
+        self.setMinimumHeight(520)
+        
+        layout = QVBoxLayout(self)
+        
+        # SEARCH CRITERIA SECTION
+        criteria_group = QGroupBox("Search Criteria")
+        criteria_layout = QGridLayout(criteria_group)
+        criteria_layout.setHorizontalSpacing(12)
+        criteria_layout.setVerticalSpacing(10)
+        criteria_layout.setColumnStretch(0, 0)
+        criteria_layout.setColumnStretch(1, 1)
+        criteria_layout.setColumnStretch(2, 0)
+        criteria_layout.setColumnStretch(3, 1)
+        
+        # Patient ID
+        criteria_layout.addWidget(QLabel("Patient ID:"), 0, 0)
+        self.patient_id_edit = QLineEdit()
+        self.patient_id_edit.setPlaceholderText("e.g. 0007/25")
+        criteria_layout.addWidget(self.patient_id_edit, 0, 1)
+        
+        # Patient Name
+        criteria_layout.addWidget(QLabel("Name:"), 0, 2)
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("Full or partial name")
+        criteria_layout.addWidget(self.name_edit, 0, 3)
+        
+        # Doctor
+        criteria_layout.addWidget(QLabel("Doctor:"), 1, 0)
+        self.doctor_edit = QLineEdit()
+        self.doctor_edit.setPlaceholderText("Doctor or consultant name")
+        criteria_layout.addWidget(self.doctor_edit, 1, 1)
+        
+        # Date Range
+        criteria_layout.addWidget(QLabel("Date From:"), 1, 2)
+        self.date_from_edit = QDateEdit(self._month_ago)
+        self.date_from_edit.setCalendarPopup(True)
+        self.date_from_edit.setDisplayFormat("dd/MM/yyyy")
+        criteria_layout.addWidget(self.date_from_edit, 1, 3)
+        
+        # Hospital filter
+        criteria_layout.addWidget(QLabel("Hospital:"), 2, 0)
+        self.hospital_edit = QLineEdit()
+        self.hospital_edit.setPlaceholderText("Hospital or facility name")
+        criteria_layout.addWidget(self.hospital_edit, 2, 1)
+        
+        criteria_layout.addWidget(QLabel("Date To:"), 2, 2)
+        self.date_to_edit = QDateEdit(self._today)
+        self.date_to_edit.setCalendarPopup(True)
+        self.date_to_edit.setDisplayFormat("dd/MM/yyyy")
+        criteria_layout.addWidget(self.date_to_edit, 2, 3)
+        
+        # Use Date Range checkbox
+        self.use_date_checkbox = QCheckBox("Use Date Range")
+        criteria_layout.addWidget(self.use_date_checkbox, 3, 0, 1, 2)
+        self.use_date_checkbox.toggled.connect(self.handle_date_toggle)
+        self.handle_date_toggle(False)
+        
+        # Search button
+        button_layout = QHBoxLayout()
+        self.search_button = QPushButton("Search")
+        self.search_button.clicked.connect(self.perform_search)
+        self.clear_button = QPushButton("Clear")
+        self.clear_button.clicked.connect(self.clear_search)
+        button_layout.addWidget(self.search_button)
+        button_layout.addWidget(self.clear_button)
+        button_layout.addStretch()
+        
+        criteria_layout.addLayout(button_layout, 4, 0, 1, 4)
+        
+        # Search automatically once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self.perform_search)
+        for edit in (self.patient_id_edit, self.name_edit, self.doctor_edit, self.hospital_edit):
+            edit.textChanged.connect(self._search_timer.start)
+        
+        layout.addWidget(criteria_group)
+        
+        self.results_summary_label = QLabel()
+        self.results_summary_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(self.results_summary_label)
+        
+        # RESULTS TABLE (model-backed so only visible rows cost anything)
+        self.results_model = PatientResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        header_font = self.results_table.horizontalHeader().font()
+        header_font.setBold(True)
+        self.results_table.horizontalHeader().setFont(header_font)
+        self.results_table.horizontalHeader().setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.results_table.horizontalHeader().setMinimumHeight(30)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.setShowGrid(True)
+        self.results_table.verticalHeader().setDefaultSectionSize(34)
+        self.results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.results_table.doubleClicked.connect(self.handle_row_double_clicked)
+        # Keep the database order until a header is clicked
+        self.results_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.results_table.setSortingEnabled(True)
+        layout.addWidget(self.results_table)
+        
+        # BUTTON ROW
+        button_row = QHBoxLayout()
+        self.select_button = QPushButton("Select")
+        self.select_button.clicked.connect(self.handle_select_clicked)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        
+        button_row.addStretch()
+        button_row.addWidget(self.select_button)
+        button_row.addWidget(self.cancel_button)
+        
+        layout.addLayout(button_row)
+    
+    def load_recent_patients(self):
+        """Load recent patients into the results table"""
+        try:
+            # Supersede a pending auto-search (e.g. from clearing the fields)
+            self._search_timer.stop()
+            self._cancel_search()
+            
+            # Empty criteria gets recent patients
+            effective_limit = self.recent_limit if self.recent_limit and self.recent_limit > 0 else None
+            if effective_limit:
+                patients = self.search.get_recent_patients(effective_limit)
+                self.populate_results(patients, context="recent", limited=True)
+            else:
+                self.populate_results_paged({}, context="recent")
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error loading recent patients: {e}")
+    
+    def perform_search(self):
+        """Perform patient search based on criteria"""
+        try:
+            # Add date range if checked
+            date_from = date_to = None
+            if self.use_date_checkbox.isChecked():
+                # Half-open timestamp range: from midnight up to (not including) the day after
+                date_from = self.date_from_edit.date().toString("yyyy-MM-dd") + " 00:00:00"
+                date_to = self.date_to_edit.date().addDays(1).toString("yyyy-MM-dd") + " 00:00:00"
+            
+            # Collect search criteria (empty fields are ignored)
+            criteria = PatientCriteria(
+                patient_id=self.patient_id_edit.text().strip(),
+                name=self.name_edit.text().strip(),
+                doctor=self.doctor_edit.text().strip(),
+                hospital=self.hospital_edit.text().strip(),
+                date_from=date_from,
+                date_to=date_to
+            )
+            
+            # Perform search
+            self.populate_results_paged(criteria, context="search")
+            
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error performing search: {e}")
+    
+    def clear_search(self):
+        """Clear search criteria and reload recent patients"""
+        self.patient_id_edit.clear()
+        self.name_edit.clear()
+        self.doctor_edit.clear()
+        self.hospital_edit.clear()
+        self.use_date_checkbox.setChecked(False)
+        
+        # Reset date range to default
+        self.date_from_edit.setDate(self._month_ago)
+        self.date_to_edit.setDate(self._today)
+        
+        # Reload recent patients
+        self.load_recent_patients()
+    
+    def populate_results(self, patients, context="search", limited=False):
+        """Populate the results table with patients
+        
+        Args:
+            patients: List of patient records
+        """
+        self.results_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.results_model.reset_rows(patients)
+        self.update_results_summary(len(patients), context=context, limited=limited)
+    
+    def populate_results_paged(self, criteria, context="search"):
+        """Show all patients matching criteria, loading further pages while scrolling
+        
+        The count and first page are read on a SearchWorker; an earlier
+        search still in flight is cancelled and its results dropped.
+        
+        Args:
+            criteria: Dictionary of search criteria
+            context: "search" or "recent" (for the summary text)
+        """
+        self._search_timer.stop()
+        self._cancel_search()
+        
+        worker = SearchWorker(self.db, criteria, PatientResultsModel.PAGE_SIZE)
+        worker.signals.finished.connect(
+            lambda rows, stream, total: self._handle_search_finished(worker, rows, stream, total, context),
+            Qt.QueuedConnection
+        )
+        worker.signals.failed.connect(
+            lambda message: self._handle_search_failed(worker, message),
+            Qt.QueuedConnection
+        )
+        self._search_worker = worker
+        self.search_button.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _handle_search_finished(self, worker, rows, stream, total, context):
+        """Show a finished background search if it is still the current one"""
+        if worker is not self._search_worker or worker.cancelled:
+            stream.close()
+            return
+        self._search_worker = None
+        self.search_button.setEnabled(True)
+        
+        if stream.exhausted:
+            total = len(rows)
+        criteria = worker.criteria
+        
+        def reopen(sort_key, descending):
+            return self.db.stream_patients(criteria, order_by=(sort_key, descending))
+        
+        # New results arrive in the default (latest visit first) order
+        self.results_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.results_model.reset_rows(rows, stream, max(total, len(rows)), reopen)
+        self.update_results_summary(self.results_model.total_count(), context=context)
+    
+    def _handle_search_failed(self, worker, message):
+        """Report a failed background search if it is still the current one"""
+        if worker is not self._search_worker or worker.cancelled:
+            return
+        self._search_worker = None
+        self.search_button.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Error performing search: {message}")
+    
+    def _cancel_search(self):
+        """Mark the in-flight search, if any, as superseded"""
+        if self._search_worker is not None:
+            self._search_worker.cancelled = True
+            self._search_worker = None
+        self.search_button.setEnabled(True)
+    
+    def done(self, result):
+        """Drop any in-flight search and open result stream before the dialog closes"""
+        self._search_timer.stop()
+        self._cancel_search()
+        self.results_model.close_stream()
+        super().done(result)
+    
+    def handle_row_double_clicked(self, index):
+        """Handle double-click on a result row
+        
+        Args:
+            index: Table model index
+        """
+        self.handle_select_clicked()
+
+    def handle_date_toggle(self, checked):
+        """Enable/disable date pickers based on checkbox."""
+        self.date_from_edit.setEnabled(checked)
+        self.date_to_edit.setEnabled(checked)
+        if checked:
+            self.date_from_edit.setStyleSheet("")
+            self.date_to_edit.setStyleSheet("")
+
+    def update_results_summary(self, count, context="search", limited=False):
+        """Update the summary label and dialog title."""
+        if context == "recent":
+            if count == 0:
+                summary = "No patients have been saved yet."
+            elif limited and self.recent_limit and count >= self.recent_limit:
+                summary = f"Showing latest {count} patients (refine your search to narrow results)"
+            else:
+                summary = f"Showing latest {count} patient{'s' if count != 1 else ''}"
+        else:
+            if count == 0:
+                summary = "No patients match the current filters."
+            else:
+                summary = f"{count} patient{'s' if count != 1 else ''} match the current filters."
+        self.results_summary_label.setText(summary)
+        self.setWindowTitle(f"Patient Search - {count} result{'s' if count != 1 else ''}")
+    
+    def handle_select_clicked(self):
+        """Handle select button clicked"""
+        selected_rows = self.results_table.selectionModel().selectedRows()
+        
+        if not selected_rows:
+            QMessageBox.warning(self, "No Selection", "Please select a patient from the results.")
+            return
+            
+        # Get patient ID from the selected row
+        patient_id = self.results_model.patient_id(selected_rows[0].row())
+        
+        if patient_id:
+            self.selected_patient_id = patient_id
+            self.accept()
+        else:
+            QMessageBox.warning(self, "Invalid Selection", "The selected row has no patient ID.")
+
+
+class ReportSearchDialog(QDialog):
+    """Dialog for searching and selecting reports"""
+    
+    def __init__(self, search_manager, parent=None, recent_limit=200):
+        """Initialize the report search dialog
+        
+        Args:
+            search_manager: SearchManager instance (searches go through its cache)
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.search = search_manager
+        self.selected_report_id = None
+        self.recent_limit = recent_limit
+        # Default date range, shared by setup_ui and clear_search
+        self._today = QDate.currentDate()
+        self._month_ago = self._today.addMonths(-1)
+        self._reports = []  # Report records in table row order (the table is not sortable)
+        self.setup_ui()
+        self.load_recent_reports()
+    
+    def setup_ui(self):
+        """Setup the dialog UI"""
+        self.setWindowTitle("Report Search")
+        self.setMinimumWidth(800)
+        self.setMinimumHeight(500)
+        
+        layout = QVBoxLayout(self)
+        
+        # SEARCH CRITERIA SECTION
+        criteria_group = QGroupBox("Search Criteria")
+        criteria_layout = QGridLayout(criteria_group)
+        
+        # Report ID
+        criteria_layout.addWidget(QLabel("Report ID:"), 0, 0)
+        self.report_id_edit = QLineEdit()
+        criteria_layout.addWidget(self.report_id_edit, 0, 1)
+        
+        # Patient ID
+        criteria_layout.addWidget(QLabel("Patient ID:"), 0, 2)
+        self.patient_id_edit = QLineEdit()
+        criteria_layout.addWidget(self.patient_id_edit, 0, 3)
+        
+        # Status
+        criteria_layout.addWidget(QLabel("Status:"), 1, 0)
+        self.status_combo = QComboBox()
+        self.status_combo.addItem("Any", "")
+        self.status_combo.addItem("Draft", "draft")
+        self.status_combo.addItem("Final", "final")
+        self.status_combo.addItem("Amended", "amended")
+        criteria_layout.addWidget(self.status_combo, 1, 1)
+        
+        # Date Range
+        criteria_layout.addWidget(QLabel("Date From:"), 1, 2)
+        self.date_from_edit = QDateEdit(self._month_ago)
+        self.date_from_edit.setCalendarPopup(True)
+        criteria_layout.addWidget(self.date_from_edit, 1, 3)
+        
+        criteria_layout.addWidget(QLabel("Date To:"), 2, 2)
+        self.date_to_edit = QDateEdit(self._today)
+        self.date_to_edit.setCalendarPopup(True)
+        criteria_layout.addWidget(self.date_to_edit, 2, 3)
+        
+        # Use Date Range checkbox
+        self.use_date_checkbox = QCheckBox("Use Date Range")
+        criteria_layout.addWidget(self.use_date_checkbox, 2, 0, 1, 2)
+        
+        # Search button
+        button_layout = QHBoxLayout()
+        self.search_button = QPushButton("Search")
+        self.search_button.clicked.connect(self.perform_search)
+        self.clear_button = QPushButton("Clear")
+        self.clear_button.clicked.connect(self.clear_search)
+        button_layout.addWidget(self.search_button)
+        button_layout.addWidget(self.clear_button)
+        button_layout.addStretch()
+        
+        criteria_layout.addLayout(button_layout, 3, 0, 1, 4)
+        
+        layout.addWidget(criteria_group)
+        
+        # RESULTS TABLE
+        self.results_table = QTableWidget(0, 6)
+        self.results_table.setHorizontalHeaderLabels([
+            "Report ID", "Patient ID", "Date", "Status", "Findings", "Conclusions"
+        ])
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.results_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.results_table.doubleClicked.connect(self.handle_row_double_clicked)
+        layout.addWidget(self.results_table)
+        
+        # BUTTON ROW
+        button_row = QHBoxLayout()
+        self.select_button = QPushButton("Select")
+        self.select_button.clicked.connect(self.handle_select_clicked)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        
+        button_row.addStretch()
+        button_row.addWidget(self.select_button)
+        button_row.addWidget(self.cancel_button)
+        
+        layout.addLayout(button_row)
+    
+    def load_recent_reports(self):
+        """Load recent reports into the results table"""
+        try:
+            # Empty criteria gets recent reports
+            effective_limit = self.recent_limit if self.recent_limit and self.recent_limit > 0 else None
+            reports = self.search.search_reports({}, limit=effective_limit, preview=True)
+            self.populate_results(reports)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error loading recent reports: {e}")
+    
+    def perform_search(self):
+        """Perform report search based on criteria"""
+        try:
+            # Add date range if checked
+            date_from = date_to = None
+            if self.use_date_checkbox.isChecked():
+                # Half-open timestamp range: from midnight up to (not including) the day after
+                date_from = self.date_from_edit.date().toString("yyyy-MM-dd") + " 00:00:00"
+                date_to = self.date_to_edit.date().addDays(1).toString("yyyy-MM-dd") + " 00:00:00"
+            
+            # Collect search criteria (empty fields are ignored)
+            criteria = ReportCriteria(
+                report_id=self.report_id_edit.text().strip(),
+                patient_id=self.patient_id_edit.text().strip(),
+                status=self.status_combo.currentData() or "",
+                date_from=date_from,
+                date_to=date_to
+            )
+            
+            # Perform search
+            reports = self.search.search_reports(criteria, preview=True)
+            self.populate_results(reports)
+            
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error performing search: {e}")
+    
+    def clear_search(self):
+        """Clear search criteria and reload recent reports"""
+        self.report_id_edit.clear()
+        self.patient_id_edit.clear()
+        self.status_combo.setCurrentIndex(0)
+        self.use_date_checkbox.setChecked(False)
+        
+        # Reset date range to default
+        self.date_from_edit.setDate(self._month_ago)
+        self.date_to_edit.setDate(self._today)
+        
+        # Reload recent reports
+        self.load_recent_reports()
+    
+    def populate_results(self, reports):
+        """Populate the results table with reports
+        
+        Args:
+            reports: List of report records
+        """
+        self._reports = list(reports)
+        
+        # Size the table once and fill it with repaints and signals suspended
+        table = self.results_table
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(reports))
+            
+            # Add reports to table
+            for row, report in enumerate(reports):
+                # Add data to cells
+                table.setItem(row, 0, QTableWidgetItem(report.get("report_id", "")))
+                table.setItem(row, 1, QTableWidgetItem(report.get("patient_id", "")))
+                
+                # Format date for display
+                date_str = report.get("report_date", "")
+                if date_str:
+                    table.setItem(row, 2, QTableWidgetItem(_format_db_date(date_str)))
+                
+                # Status with capitalization
+                status = report.get("status", "").capitalize()
+                table.setItem(row, 3, QTableWidgetItem(status))
+                
+                # Findings and conclusions arrive already truncated for display
+                table.setItem(row, 4, QTableWidgetItem(report.get("findings_preview", "")))
+                table.setItem(row, 5, QTableWidgetItem(report.get("conclusions_preview", "")))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+        
+        # Update status message
+        self.setWindowTitle(f"Report Search - {len(reports)} results")
+    
+    def handle_row_double_clicked(self, index):
+        """Handle double-click on a result row
+        
+        Args:
+            index: Table model index
+        """
+        self.handle_select_clicked()
+    
+    def handle_select_clicked(self):
+        """Handle select button clicked"""
+        selected_rows = self.results_table.selectionModel().selectedRows()
+        
+        if not selected_rows:
+            QMessageBox.warning(self, "No Selection", "Please select a report from the results.")
+            return
+            
+        # Get report ID from the record behind the selected row
+        row = selected_rows[0].row()
+        report_id = self._reports[row].get("report_id", "") if 0 <= row < len(self._reports) else ""
+        
+        if report_id:
+            self.selected_report_id = report_id
+            self.accept()
+        else:
+            QMessageBox.warning(self, "Invalid Selection", "The selected row has no report ID.")
@@ -1,6 +1,33 @@
+import atexit
 import json
+import os
+import time
+from datetime import datetime
 from pathlib import Path
 
+from PySide6.QtCore import QTimer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Coalesce bursts of changes (e.g. many patient IDs) into one write
+_FLUSH_DELAY_MS = 1000
+
+# Two-digit year for patient IDs, refreshed at most once a minute
+_YEAR_TTL_SECONDS = 60
+_year_cache = (float("-inf"), "")
+
+
+def _current_year():
+    """Return the current two-digit year, cached for _YEAR_TTL_SECONDS"""
+    global _year_cache
+    now = time.monotonic()
+    if now - _year_cache[0] > _YEAR_TTL_SECONDS:
+        _year_cache = (now, datetime.now().strftime("%y"))
+    return _year_cache[1]
+
 
 class Settings:
     def __init__(self):
@@ -15,34 +42,58 @@ class Settings:
         }
         self.current_settings = self.load_settings()
 
+        # Changes are marked dirty and written once the burst settles
+        self._dirty = False
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        atexit.register(self.flush)
+
     def load_settings(self):
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                # orjson when installed, stdlib otherwise (both raise ValueError subclasses)
+                raw_data = self.settings_file.read_bytes()
+                return orjson.loads(raw_data) if orjson else json.loads(raw_data)
+            except ValueError:
                 return self.default_settings.copy()
         return self.default_settings.copy()
 
     def save_settings(self):
+        """Write settings now, atomically (temp file + os.replace)"""
         self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.settings_file, "w") as f:
-            json.dump(self.current_settings, f, indent=4)
+        tmp_file = self.settings_file.with_name(self.settings_file.name + ".tmp")
+        if orjson:
+            tmp_file.write_bytes(orjson.dumps(self.current_settings, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, "w") as f:
+                json.dump(self.current_settings, f, indent=4)
+        os.replace(tmp_file, self.settings_file)
+        self._dirty = False
+        self._flush_timer.stop()
+
+    def flush(self):
+        """Write pending changes, if any; call before shutdown"""
+        if self._dirty:
+            self.save_settings()
+
+    def _schedule_save(self):
+        """Mark settings dirty and (re)start the delayed flush"""
+        self._dirty = True
+        self._flush_timer.start()
 
     def get(self, key, default=None):
         return self.current_settings.get(key, default)
 
     def set(self, key, value):
         self.current_settings[key] = value
-        self.save_settings()
+        self._schedule_save()
         
     def get_next_patient_id(self, hospital=None):
         """Generate an incremental patient ID in format 0001/25 per hospital"""
-        import time
-        from datetime import datetime
-        
         # Get current year's last two digits
-        current_year = datetime.now().strftime("%y")
+        current_year = _current_year()
         
         # If no hospital is specified or empty, use a default
         if not hospital:
@@ -73,7 +124,7 @@ class Settings:
         # Format: 0001/25 (four digits, slash, two-digit year)
         patient_id = f"{counter:04d}/{current_year}"
         
-        # Save the updated counter
-        self.save_settings()
+        # Save the updated counter (batched with other changes)
+        self._schedule_save()
         
         return patient_id
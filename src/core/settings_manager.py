@@ -1,15 +1,148 @@
 # FILE: src/core/settings_manager.py
 # Ensures robust ID generation.
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer, QCoreApplication
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+import atexit
+import hashlib
 import json
 import logging
-from datetime import datetime
+import logging.handlers
+import os
+import queue
+import shutil
+import time
+import traceback
+from collections import OrderedDict, deque
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize settings to indented JSON bytes (orjson when installed, stdlib otherwise).
+
+    Non-JSON values such as Path objects are written as strings.
+    """
+    if orjson:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=4, default=str).encode("utf-8")
+
+
+_GET_CACHE_SIZE = 256 # Distinct 3+-key paths memoized by SettingsManager.get()
+_MISSING = object() # Cached marker for a key path that does not resolve
+
+
+@dataclass(frozen=True, slots=True)
+class AppPaths:
+    """Application data directories, built once by SettingsManager.setup_paths."""
+    base: Path
+    settings: Path
+    database: Path
+    reports: Path
+    images: Path
+    videos: Path
+    temp: Path
+    logs: Path
+    backup: Path
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in _APP_PATH_NAMES}
+
+
+_APP_PATH_NAMES = tuple(field.name for field in fields(AppPaths))
+
+
+class _BatchedFileHandler(logging.FileHandler):
+    """File handler fed by a QueueListener that flushes once the queue drains, not per record."""
+
+    def __init__(self, filename, log_queue):
+        super().__init__(filename)
+        self._log_queue = log_queue
+
+    def flush(self):
+        if self._log_queue.empty():
+            super().flush()
+
+
+def _clone_json(data):
+    """Deep-copy JSON-shaped data (dicts, lists and scalars).
+
+    An orjson round trip is the fastest clone for the settings tree; the pure-Python
+    walk still beats copy.deepcopy and a stdlib json round trip.
+    """
+    if orjson:
+        return orjson.loads(orjson.dumps(data))
+    data_type = type(data)
+    if data_type is dict:
+        return {key: _clone_json(value) for key, value in data.items()}
+    if data_type is list:
+        return [_clone_json(item) for item in data]
+    return data
+
+
+_SCALAR_TYPES = frozenset((int, float, bool, str, type(None)))
+
+
+def _leaf_unchanged(old, new) -> bool:
+    """No-change check for set(): identity first, then equality.
+
+    Scalars of different types (e.g. 1 and True) count as a change; strings of
+    different lengths (e.g. a replaced API key) are rejected before comparing contents.
+    """
+    if old is new: return True
+    old_type = type(old)
+    if old_type in _SCALAR_TYPES:
+        if old_type is not type(new): return False
+        if old_type is str and len(old) != len(new): return False
+    return old == new
+
+
+# ID counters live in the database; these settings.json sections are migrated there once
+_LEGACY_COUNTER_SECTIONS = ("patient_id_counters", "sequence_numbers")
+
+
+def _payload_hash(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _json_loads(raw_data):
+    """Parse JSON bytes; both parsers raise json.JSONDecodeError (or a subclass) on bad input."""
+    return orjson.loads(raw_data) if orjson else json.loads(raw_data)
+
+
+# Default settings, built once at import. Treat as read-only: SettingsManager clones it
+# (with _clone_json) before use and reads it directly only for lookups.
+_DEFAULT_SETTINGS_TEMPLATE = {
+    "application": {"theme": "dark", "language": "en", "auto_save_interval": 300, "warning_on_exit": True, "max_recent_files": 10, "default_report_format": "pdf"},
+    "hospital": {"name": "Medical Center", "logo_path": "", "address": "", "contact": "", "default_doctor": ""},
+    "camera": {"default_device": 0, "resolution": "1920x1080", "format": "MJPG", "fps": 30, "auto_exposure": True, "exposure": 0, "white_balance": "auto", "contrast": 0, "brightness": 0, "saturation": 0},
+    "paths": {}, # Filled per instance from SettingsManager.paths
+    "ui": {"font_size": 10, "show_toolbar": True, "show_statusbar": True, "panel_ratio": 40},
+    "footswitch": {"enabled": False, "selected_device_path": None, "capture_pedal_input_code": None, "record_pedal_input_code": None},
+    "ai_refinement": {
+        "enabled": True,
+        "provider": "openai",
+        "model": "gpt-4.1",
+        "temperature": 0.2,
+        "max_tokens": 900,
+        "brevity_default": True,
+        "api_key_env": "OPENAI_API_KEY",
+        "stored_api_key": ""
+    }
+}
+
 
 class SettingsManager(QObject):
-    settings_changed = Signal(dict)
+    MAX_BACKUPS = 20 # Timestamped settings backups kept in backup_settings_dir
+    BACKUP_PRUNE_INTERVAL = 10 # Prune on the first backup of a session, then every Nth
+
+    settings_changed = Signal(tuple, object) # Emits the changed key path and its new value
     theme_changed = Signal(str)
     camera_settings_changed = Signal(dict)
     path_changed = Signal(str, Path)
@@ -18,12 +151,43 @@ class SettingsManager(QObject):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.paths = {} # Initialize before setup_paths
+        self.paths: Optional[AppPaths] = None # Built by setup_paths
         self.settings = {} # Initialize before load_settings
+        # set() marks settings dirty; bursts of changes are written once after a short delay
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_save)
+        self._last_saved_hash = None # Hash of the bytes last read from / written to settings.json
+        self._snapshot = None # Cached copy for snapshot(); dropped on every change
+        self._get_cache = OrderedDict() # key path -> resolved value (or _MISSING); cleared on every change
+        self._backup_count = 0
+        self._year_cache = (None, None) # (year, two-digit string) for ID generation
+        self.db_manager = None # DatabaseManager holding the ID counters (set_database_manager)
+        # Section-specific signals emitted by set(), keyed on the top-level section
+        self._section_signals = {
+            "application": self._emit_application,
+            "camera": self._emit_camera,
+            "paths": self._emit_path,
+            "footswitch": self._emit_footswitch,
+        }
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+        self._loaded = False # Paths and settings file are set up on first use (_ensure_loaded)
         self.setup_logging() # Logging can start early
+
+    def _ensure_loaded(self):
+        if self._loaded: return
+        self._loaded = True # Set first: loading may save, which checks again
         self.setup_paths()   # Defines self.paths and self.settings_file
         self.load_settings() # Loads or creates default settings
 
+    def preload(self):
+        """Set up paths and load settings now instead of on first access (e.g. after the splash screen)."""
+        self._ensure_loaded()
+
     def setup_logging(self):
         self.logger = logging.getLogger("SettingsManager")
         # Basic config if handlers not set, actual file handler setup in setup_paths
@@ -38,151 +202,225 @@ class SettingsManager(QObject):
         project_root_path = Path(__file__).resolve().parent.parent.parent 
         data_dir = project_root_path / "data"
 
-        self.paths = {
-            "base": data_dir,
-            "settings": data_dir / "settings",
-            "database": data_dir / "database",
-            "reports": data_dir / "reports",
-            "images": data_dir / "images" / "captured",
-            "videos": data_dir / "videos" / "captured",
-            "temp": data_dir / "temp",
-            "logs": data_dir / "logs",
-            "backup": data_dir / "backup",
-        }
-        for path_key in self.paths:
-            self.paths[path_key].mkdir(parents=True, exist_ok=True)
+        self.paths = AppPaths(
+            base=data_dir,
+            settings=data_dir / "settings",
+            database=data_dir / "database",
+            reports=data_dir / "reports",
+            images=data_dir / "images" / "captured",
+            videos=data_dir / "videos" / "captured",
+            temp=data_dir / "temp",
+            logs=data_dir / "logs",
+            backup=data_dir / "backup",
+        )
+        # One scandir of data_dir tells which top-level directories exist; only missing ones are created
+        existing = set()
+        if data_dir.is_dir():
+            with os.scandir(data_dir) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+            existing.add(".") # data_dir itself
+        for path in self.paths.as_dict().values():
+            if path == data_dir: present = "." in existing
+            elif path.parent == data_dir: present = path.name in existing
+            else: present = path.is_dir() # Nested (images/captured, videos/captured)
+            if not present: path.mkdir(parents=True, exist_ok=True)
+        self._paths_str = {key: str(path) for key, path in self.paths.as_dict().items()} # JSON/get_path form
         
-        self.settings_file = self.paths["settings"] / "settings.json"
-        self.backup_settings_dir = self.paths["settings"] / "backup"
-        self.backup_settings_dir.mkdir(exist_ok=True)
+        self.settings_file = self.paths.settings / "settings.json"
+        self.backup_settings_dir = self.paths.settings / "backup"
+        if not self.backup_settings_dir.is_dir(): self.backup_settings_dir.mkdir(exist_ok=True)
 
         # Re-initialize logger with correct file path now that paths are defined
         # This overwrites basicConfig if it was called.
-        log_file_path = self.paths["logs"] / "settings.log"
+        log_file_path = self.paths.logs / "settings.log"
         self.logger.handlers.clear() # Remove any default handlers
-        fh = logging.FileHandler(log_file_path)
+        if getattr(self, "_log_listener", None): self._log_listener.stop()
+        # Callers only enqueue records; a listener thread writes them to the file
+        log_queue = queue.SimpleQueue()
+        fh = _BatchedFileHandler(log_file_path, log_queue)
         formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
         fh.setFormatter(formatter)
-        self.logger.addHandler(fh)
+        self._log_listener = logging.handlers.QueueListener(log_queue, fh)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop) # Runs after aboutToQuit, so the final flush is logged
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
         self.logger.setLevel(logging.INFO) # Ensure level is set after adding handler
         self.logger.propagate = False # Prevent logging to root if ErrorHandler also configures root
         self.logger.info("SettingsManager logging initialized with file handler.")
 
 
     def load_settings(self):
-        self.default_settings = {
-            "application": {"theme": "dark", "language": "en", "auto_save_interval": 300, "warning_on_exit": True, "max_recent_files": 10, "default_report_format": "pdf"},
-            "hospital": {"name": "Medical Center", "logo_path": "", "address": "", "contact": "", "default_doctor": ""},
-            "camera": {"default_device": 0, "resolution": "1920x1080", "format": "MJPG", "fps": 30, "auto_exposure": True, "exposure": 0, "white_balance": "auto", "contrast": 0, "brightness": 0, "saturation": 0},
-            "paths": {key: str(val) for key, val in self.paths.items()}, # Ensure paths are strings for JSON
-            "sequence_numbers": {"last_patient_id": 0, "last_report_id": 0},
-            "patient_id_counters": {},
-            "ui": {"font_size": 10, "show_toolbar": True, "show_statusbar": True, "panel_ratio": 40},
-            "footswitch": {"enabled": False, "selected_device_path": None, "capture_pedal_input_code": None, "record_pedal_input_code": None},
-            "ai_refinement": {
-                "enabled": True,
-                "provider": "openai",
-                "model": "gpt-4.1",
-                "temperature": 0.2,
-                "max_tokens": 900,
-                "brevity_default": True,
-                "api_key_env": "OPENAI_API_KEY",
-                "stored_api_key": ""
-            }
-        }
+        self._get_cache.clear()
+        # Cloned so set() on one manager never touches the shared template
+        self.default_settings = _clone_json(_DEFAULT_SETTINGS_TEMPLATE)
+        self.default_settings["paths"] = dict(self._paths_str) # Paths as strings for JSON
         try:
             if self.settings_file.exists() and self.settings_file.stat().st_size > 0:
-                with open(self.settings_file, "r") as f:
-                    saved_settings = json.load(f)
-                    self.settings = self.merge_settings(self.default_settings, saved_settings)
+                raw_data = self.settings_file.read_bytes()
+                saved_settings = _json_loads(raw_data)
+                self._last_saved_hash = _payload_hash(raw_data)
+                self.settings = self.merge_settings(self.default_settings, saved_settings)
                 self.logger.info("Settings loaded successfully.")
             else:
-                self.settings = self.default_settings.copy()
+                self.settings = _clone_json(self.default_settings)
                 self.save_settings()
                 self.logger.info("Default settings created and saved as file was missing or empty.")
         except json.JSONDecodeError as e:
             self.logger.error(f"Error decoding settings.json: {e}. Attempting to use backup or defaults.")
-            self.settings = self.default_settings.copy() # Fallback
+            self.settings = _clone_json(self.default_settings) # Fallback
             self.error_occurred.emit(f"Settings file corrupted. Defaults loaded. Error: {e}")
         except Exception as e:
             self.logger.error(f"Error loading settings: {e}. Using default settings.")
-            self.settings = self.default_settings.copy()
+            self.settings = _clone_json(self.default_settings)
             self.error_occurred.emit(f"Error loading settings: {e}. Defaults loaded.")
 
     def merge_settings(self, defaults, saved):
-        merged = defaults.copy()
-        for key, value in saved.items():
-            if isinstance(value, dict) and isinstance(merged.get(key), dict):
-                merged[key] = self.merge_settings(merged[key], value)
-            else:
-                merged[key] = value
-        for key, default_value in defaults.items(): # Ensure all top-level default sections exist
-            if key not in merged: merged[key] = default_value
-            elif isinstance(default_value, dict): # Ensure sub-keys for dict sections
-                 if not isinstance(merged.get(key), dict): merged[key] = default_value.copy()
-                 else:
-                    for sub_key, sub_default_value in default_value.items():
-                        if sub_key not in merged[key]: merged[key][sub_key] = sub_default_value
+        # One deep copy guarantees every default key exists and shares nothing with defaults;
+        # saved values are then laid over it level by level
+        merged = _clone_json(defaults)
+        pending = deque([(merged, saved)])
+        while pending:
+            target, source = pending.popleft()
+            for key, value in source.items():
+                current = target.get(key)
+                if not isinstance(current, dict): target[key] = value
+                elif isinstance(value, dict): pending.append((current, value))
+                # A default section is kept when the saved value is not a dict
         return merged
 
     def save_settings(self):
+        if not self._loaded: self._ensure_loaded()
+        self._snapshot = None # import/reset replace self.settings before saving
+        self._get_cache.clear()
         try:
+            payload = _json_dumps(self.settings)
+            payload_hash = _payload_hash(payload)
+            if payload_hash == self._last_saved_hash and self.settings_file.exists():
+                return # Nothing changed since the last write; skip backup and write
             if self.settings_file.exists() and self.settings_file.stat().st_size > 0:
                 self.backup_settings_dir.mkdir(parents=True, exist_ok=True)
                 backup_file = self.backup_settings_dir / f"settings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
                 try:
-                    with open(self.settings_file, "r") as src_f: current_data = json.load(src_f) # ensure valid before backup
-                    with open(backup_file, "w") as dst_f: json.dump(current_data, dst_f, indent=4)
+                    # Hardlink the current file: the replace below gives settings.json a new
+                    # inode, so the backup keeps the old content without copying it
+                    if backup_file.exists(): backup_file.unlink()
+                    try: os.link(self.settings_file, backup_file)
+                    except OSError: shutil.copyfile(self.settings_file, backup_file) # No hardlinks here: raw byte copy
                     self.logger.info(f"Settings backup created: {backup_file}")
-                except (IOError, json.JSONDecodeError) as backup_err:
-                    self.logger.error(f"Failed to create settings backup (source invalid or unwritable): {backup_err}")
+                    if self._backup_count % self.BACKUP_PRUNE_INTERVAL == 0: self._prune_backups()
+                    self._backup_count += 1
+                except OSError as backup_err:
+                    self.logger.error(f"Failed to create settings backup: {backup_err}")
             
-            with open(self.settings_file, "w") as f:
-                json.dump(self.settings, f, indent=4)
+            # Write a temp file and swap it in, so a crash never leaves a partial settings.json
+            tmp_file = self.settings_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
+            self._last_saved_hash = payload_hash
             self.logger.info("Settings saved successfully.")
         except Exception as e:
             self.logger.error(f"Error saving settings: {e}"); self.error_occurred.emit(f"Error saving settings: {e}")
 
+    def _prune_backups(self):
+        # Timestamped names sort chronologically; exports (settings_export_*) are left alone
+        backups = sorted(self.backup_settings_dir.glob("settings_[0-9]*.json"), reverse=True)
+        for old_backup in backups[self.MAX_BACKUPS:]:
+            try: old_backup.unlink(missing_ok=True)
+            except OSError as prune_err: self.logger.warning(f"Could not remove old settings backup {old_backup}: {prune_err}")
+
+    def _flush_save(self):
+        if self._dirty:
+            self._dirty = False
+            self.save_settings()
+
+    def flush(self):
+        """Write pending changes now (for durability-critical values and shutdown)."""
+        self._save_timer.stop()
+        self._flush_save()
+
     def get(self, *keys, default=None):
+        if not self._loaded: self._ensure_loaded()
+        # Fast paths: one or two keys cover nearly every call site and are as cheap as a cache probe
+        key_count = len(keys)
+        if key_count == 1:
+            return self.settings.get(keys[0], default)
+        if key_count == 2:
+            section = self.settings.get(keys[0])
+            return section.get(keys[1], default) if type(section) is dict else default
         try:
-            value = self.settings
-            for key in keys:
-                if not isinstance(value, dict): return default
-                value = value[key]
-            return value
-        except KeyError: return default
-        except Exception as e: self.logger.warning(f"Error getting setting '{'.'.join(keys)}': {e}"); return default
+            value = self._get_cache[keys]
+            self._get_cache.move_to_end(keys)
+        except KeyError:
+            try: value = self._resolve(keys)
+            except Exception as e: self.logger.warning(f"Error getting setting '{'.'.join(keys)}': {e}"); return default
+            self._get_cache[keys] = value
+            if len(self._get_cache) > _GET_CACHE_SIZE: self._get_cache.popitem(last=False)
+        return default if value is _MISSING else value
+
+    def _resolve(self, keys):
+        value = self.settings
+        for key in keys:
+            if not isinstance(value, dict) or key not in value: return _MISSING
+            value = value[key]
+        return value
 
     def set(self, *keys, value):
+        if not self._loaded: self._ensure_loaded()
         try:
             target = self.settings
             for key in keys[:-1]:
                 target = target.setdefault(key, {}) # Ensure path exists
                 if not isinstance(target, dict): # Path became non-dict, error
-                    self.logger.error(f"Cannot set nested key; '{key}' in '{'.'.join(keys)}' is not a dictionary."); return False
+                    self.logger.error("Cannot set nested key; '%s' in '%s' is not a dictionary.", key, ".".join(keys)); return False
             
             last_key = keys[-1]
-            current_value = target.get(last_key)
-            if current_value == value: return True # No change
+            current_value = target.get(last_key, _MISSING)
+            if _leaf_unchanged(current_value, value): return True # No change
 
             target[last_key] = value
-            self.save_settings()
-            if keys[0] == "ai_refinement" and last_key == "stored_api_key":
-                display_val = "***"
-            else:
-                display_val = value
-            self.logger.info(f"Setting updated: {'.'.join(keys)} = {display_val}")
-            self.settings_changed.emit(self.settings.copy())
+            self._snapshot = None
+            self._get_cache.clear()
+            self._dirty = True
+            self._save_timer.start()
+            if self.logger.isEnabledFor(logging.INFO): # Skip building the message when it would be dropped
+                if keys[0] == "ai_refinement" and last_key == "stored_api_key":
+                    display_val = "***"
+                else:
+                    display_val = value
+                self.logger.info("Setting updated: %s = %s", ".".join(keys), display_val)
+            self.settings_changed.emit(tuple(keys), value)
             
-            if keys[0] == "application" and last_key == "theme": self.theme_changed.emit(value)
-            elif keys[0] == "camera": self.camera_settings_changed.emit(self.get("camera", default={}).copy())
-            elif keys[0] == "paths" and len(keys) > 1: self.path_changed.emit(keys[1], Path(value))
-            elif keys[0] == "footswitch": self.footswitch_config_changed.emit(self.get("footswitch", default={}).copy())
+            emitter = self._section_signals.get(keys[0])
+            if emitter: emitter(keys, value, self.settings[keys[0]])
             return True
         except Exception as e:
-            self.logger.error(f"Error setting value for {'.'.join(keys)}: {e}"); self.error_occurred.emit(f"Error setting {'.'.join(keys)}: {e}")
+            key_path = ".".join(keys)
+            self.logger.error("Error setting value for %s: %s", key_path, e); self.error_occurred.emit(f"Error setting {key_path}: {e}")
             return False
 
+    # Section emitters for set(): (key path, new value, top-level section dict)
+    def _emit_application(self, keys, value, section):
+        if keys[-1] == "theme": self.theme_changed.emit(value)
+
+    def _emit_camera(self, keys, value, section):
+        self.camera_settings_changed.emit(section.copy()) # Listeners get their own copy
+
+    def _emit_path(self, keys, value, section):
+        if len(keys) > 1: self.path_changed.emit(keys[1], Path(value))
+
+    def _emit_footswitch(self, keys, value, section):
+        self.footswitch_config_changed.emit(section.copy())
+
+    def snapshot(self):
+        """Top-level copy of all settings, for callers that need the whole dict."""
+        if not self._loaded: self._ensure_loaded()
+        if self._snapshot is None:
+            self._snapshot = self.settings.copy()
+        return self._snapshot
+
     def get_theme(self): return self.get("application", "theme", default="dark")
     def set_theme(self, theme_name):
         return self.set("application", "theme", value=theme_name) if theme_name in ["light", "dark", "professional"] else False
@@ -192,101 +430,126 @@ class SettingsManager(QObject):
     def set_camera_resolution(self, width, height): return self.set("camera", "resolution", value=f"{width}x{height}")
 
     def get_path(self, path_type: str) -> Path:
-        if not self.paths: self.setup_paths() # Should be already done by init
-        default_path_str = str(self.paths.get(path_type, Path("data") / path_type)) # Fallback if not in self.paths
+        if not self._loaded: self._ensure_loaded()
+        default_path_str = self._paths_str.get(path_type) or str(Path("data") / path_type) # Fallback if not in self.paths
         # Get path from settings, use default from self.paths if not found in settings
         path_str = self.get("paths", path_type, default=default_path_str)
         return Path(path_str)
 
     def set_path(self, path_type, new_path): return self.set("paths", path_type, value=str(new_path))
 
+    def _current_year_str(self) -> str:
+        year = date.today().year
+        if self._year_cache[0] != year:
+            self._year_cache = (year, f"{year % 100:02d}")
+        return self._year_cache[1]
+
     def get_next_patient_id(self, hospital: Optional[str] = None) -> Optional[str]:
+        patient_ids = self.reserve_patient_ids(1, hospital)
+        return patient_ids[0] if patient_ids else f"ERR_PID_{time.monotonic_ns()}"
+
+    def set_database_manager(self, db_manager):
+        """Attach the DatabaseManager whose patient_id_seq and id_sequences tables allocate IDs."""
+        self.db_manager = db_manager
+
+    def _migrate_legacy_counters(self):
+        """Move ID counters still held in settings.json into the database (once)."""
+        legacy = {name: self.settings[name] for name in _LEGACY_COUNTER_SECTIONS if name in self.settings}
+        if not legacy: return
+        patient_counters = legacy.get("patient_id_counters")
+        rows = [
+            (key, str(record.get("year", "")), record["counter"])
+            for key, record in (patient_counters if isinstance(patient_counters, dict) else {}).items()
+            if isinstance(record, dict) and isinstance(record.get("counter"), int)
+        ]
+        sequence_numbers = legacy.get("sequence_numbers")
+        last_report_id = (sequence_numbers if isinstance(sequence_numbers, dict) else {}).get("last_report_id", 0)
+        try: last_report_id = int(last_report_id)
+        except (TypeError, ValueError): last_report_id = 0
+        self.db_manager.seed_counters(rows, {"last_report_id": last_report_id})
+        self.logger.info("Migrated %d patient ID counter(s) and the report sequence to the database", len(rows))
+        for name in legacy: del self.settings[name]
+        self._snapshot = None
+        self._get_cache.clear()
+        self.save_settings() # Drop the migrated sections from settings.json
+
+    def reserve_patient_ids(self, count: int, hospital: Optional[str] = None) -> List[str]:
+        """Reserve `count` consecutive patient IDs with one update of the database's patient_id_seq.
+
+        Returns the IDs in order, or an empty list if the counter could not be updated.
+        """
+        if not self._loaded: self._ensure_loaded()
         try:
-            current_year = datetime.now().strftime("%y")
+            if count < 1: return []
+            current_year = self._current_year_str()
             hospital_name = (hospital or self.get("hospital", "name", default="General Hospital") or "General Hospital").strip()
             if not hospital_name:
                 hospital_name = "General Hospital"
 
-            counters = self.settings.setdefault("patient_id_counters", {})
-            normalized_key = hospital_name.lower()
-            existing_record = counters.get(normalized_key, {})
-
-            record_year = existing_record.get("year")
-            record_counter = existing_record.get("counter", 0)
-            if record_year != current_year or not isinstance(record_counter, int):
-                record_counter = 0
-
-            record_counter += 1
-            updated_record = {
-                "year": current_year,
-                "counter": record_counter,
-                "display_name": hospital_name,
-            }
-            if not self.set("patient_id_counters", normalized_key, value=updated_record):
-                self.logger.error(f"Failed to persist patient ID counter for hospital '{hospital_name}'")
-                return f"ERR_PID_SAVE_{datetime.now().strftime('%S%f')}"
-
-            return f"{record_counter:04d}/{current_year}"
+            if self.db_manager is None:
+                self.logger.error("Cannot reserve patient IDs: no database manager attached")
+                return []
+            self._migrate_legacy_counters()
+            # Counters are keyed per year, so a new year starts again at 1
+            last_counter = self.db_manager.next_patient_counter(hospital_name.lower(), current_year, count)
+
+            return [f"{counter:04d}/{current_year}" for counter in range(last_counter - count + 1, last_counter + 1)]
         except Exception as e:
-            self.logger.error(f"Error generating next patient ID: {e}\n{traceback.format_exc()}")
-            return f"ERR_PID_EXC_{datetime.now().strftime('%S%f')}"
+            self.logger.error(f"Error reserving patient IDs: {e}\n{traceback.format_exc()}")
+            return []
 
     def get_next_report_id(self) -> Optional[str]:
+        if not self._loaded: self._ensure_loaded()
         try:
-            if "sequence_numbers" not in self.settings:
-                self.settings["sequence_numbers"] = self.default_settings["sequence_numbers"].copy()
-
-            current_val = self.settings["sequence_numbers"].get("last_report_id", 0)
-            if not isinstance(current_val, int):
-                try: current_val = int(current_val)
-                except ValueError: current_val = 0
-            
-            next_id_num = current_val + 1
-            success = self.set("sequence_numbers", "last_report_id", value=next_id_num)
-            if not success:
-                self.logger.error("Failed to save incremented report ID to settings.")
-                return f"ERR_RID_SAVE_{datetime.now().strftime('%S%f')}"
+            if self.db_manager is None:
+                self.logger.error("Cannot generate report ID: no database manager attached")
+                return f"ERR_RID_NODB_{time.monotonic_ns()}"
+            self._migrate_legacy_counters()
+            next_id_num = self.db_manager.next_sequence_value("last_report_id")
 
-            year_str = datetime.now().strftime("%y")
+            year_str = self._current_year_str()
             return f"R-{next_id_num:04d}/{year_str}"
         except Exception as e:
             self.logger.error(f"Error generating next report ID: {e}\n{traceback.format_exc()}")
-            return f"ERR_RID_EXC_{datetime.now().strftime('%S%f')}"
+            return f"ERR_RID_EXC_{time.monotonic_ns()}"
 
     def export_settings(self, file_path=None): # ... (same as before) ...
+        if not self._loaded: self._ensure_loaded()
         try:
             export_path = Path(file_path) if file_path else \
                           self.backup_settings_dir / f"settings_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             export_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(export_path, "w") as f: json.dump(self.settings, f, indent=4)
+            export_path.write_bytes(_json_dumps(self.settings))
             self.logger.info(f"Settings exported to: {export_path}"); return str(export_path)
         except Exception as e: self.logger.error(f"Err export settings: {e}"); self.error_occurred.emit(f"Err export: {e}"); return None
 
     def import_settings(self, file_path): # ... (same as before) ...
+        if not self._loaded: self._ensure_loaded()
         try:
             import_path = Path(file_path)
             if not import_path.exists(): self.logger.error(f"Import file N/F: {import_path}"); self.error_occurred.emit(f"Import file N/F: {import_path}"); return False
-            with open(import_path, "r") as f: imported_settings = json.load(f)
+            imported_settings = _json_loads(import_path.read_bytes())
             self.export_settings() # Backup current
-            self.settings = self.merge_settings(self.default_settings.copy(), imported_settings)
+            self.settings = self.merge_settings(self.default_settings, imported_settings)
             self.save_settings(); self.logger.info(f"Settings imported from: {import_path}"); return True
         except Exception as e: self.logger.error(f"Err import settings: {e}"); self.error_occurred.emit(f"Err import: {e}"); return False
 
     def reset_to_defaults(self, section=None): # ... (same as before) ...
+        if not self._loaded: self._ensure_loaded()
         try:
             self.export_settings() 
             if section:
-                if section in self.default_settings: self.settings[section] = json.loads(json.dumps(self.default_settings[section]))
+                if section in self.default_settings: self.settings[section] = _clone_json(self.default_settings[section])
                 else: self.logger.warning(f"Attempted reset non-existent section: {section}"); return False
-            else: self.settings = json.loads(json.dumps(self.default_settings))
+            else: self.settings = _clone_json(self.default_settings)
             self.save_settings(); self.logger.info(f"Settings reset: {section or 'all'}"); return True
         except Exception as e: self.logger.error(f"Err reset settings: {e}"); self.error_occurred.emit(f"Err reset: {e}"); return False
 
     def get_footswitch_config(self):
-        return self.get("footswitch", default=self.default_settings["footswitch"].copy()).copy()
+        return self.get("footswitch", default=_DEFAULT_SETTINGS_TEMPLATE["footswitch"]).copy()
 
     def set_footswitch_config_value(self, key, value):
-        if key not in self.default_settings["footswitch"]:
+        if key not in _DEFAULT_SETTINGS_TEMPLATE["footswitch"]:
             self.logger.warning(f"Attempted to set invalid footswitch config key: {key}"); return False
         return self.set("footswitch", key, value=value)
 
@@ -1,63 +1,28 @@
 # FIXED THEME_MANAGER.PY - CONSOLIDATED THEMES AND FIXED TEXT VISIBILITY
 # FILE: src/core/theme_manager.py
 
+import functools
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtCore import QObject, Signal
 
-class ThemeManager(QObject):
-    """Manager for application themes and styling with improved dark mode support"""
-    
-    # SIGNALS
-    theme_applied = Signal(str)  # Emits theme name when applied
-    
-    def __init__(self, settings_manager=None, parent=None):
-        """Initialize the theme manager
-        
-        Args:
-            settings_manager: SettingsManager instance for accessing saved theme
-            parent: Parent QObject
-        """
-        super().__init__(parent)
-        self.settings = settings_manager
-        self.current_theme = "dark"  # Default theme
-        
-        # Initialize theme definitions - CONSOLIDATED AND FIXED
-        self.themes = {
-            "light": self.get_light_theme(),
-            "dark": self.get_dark_theme(),
-            "professional": self.get_professional_theme(),  # RENAMED FROM PRO_DARK
-        }
-        
-        # Load saved theme if available
-        if self.settings:
-            saved_theme = self.settings.get_theme()
-            # Handle legacy theme names
-            if saved_theme == "pro_dark":
-                saved_theme = "professional"
-            if saved_theme in self.themes:
-                self.current_theme = saved_theme
-    
-    def get_light_theme(self):
-        """Get light theme stylesheet and palette
-        
-        Returns:
-            Dictionary with theme components
-        """
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(240, 240, 240))
-        palette.setColor(QPalette.WindowText, QColor(0, 0, 0))
-        palette.setColor(QPalette.Base, QColor(255, 255, 255))
-        palette.setColor(QPalette.AlternateBase, QColor(245, 245, 245))
-        palette.setColor(QPalette.Text, QColor(0, 0, 0))
-        palette.setColor(QPalette.Button, QColor(240, 240, 240))
-        palette.setColor(QPalette.ButtonText, QColor(0, 0, 0))
-        palette.setColor(QPalette.Link, QColor(0, 0, 255))
-        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        
-        # Light theme stylesheet
-        stylesheet = """
+# THEME DEFINITIONS - palette colors and stylesheets, shared by every ThemeManager
+_LIGHT_PALETTE_SPEC = (
+    (QPalette.Window, 240, 240, 240),
+    (QPalette.WindowText, 0, 0, 0),
+    (QPalette.Base, 255, 255, 255),
+    (QPalette.AlternateBase, 245, 245, 245),
+    (QPalette.Text, 0, 0, 0),
+    (QPalette.Button, 240, 240, 240),
+    (QPalette.ButtonText, 0, 0, 0),
+    (QPalette.Link, 0, 0, 255),
+    (QPalette.Highlight, 42, 130, 218),
+    (QPalette.HighlightedText, 255, 255, 255),
+)
+
+# Light theme stylesheet
+_LIGHT_QSS = """
             QMainWindow {
                 background-color: #f0f0f0;
                 color: #000000;
@@ -138,34 +103,22 @@ class ThemeManager(QObject):
                 padding: 0 3px;
             }
         """
-        
-        return {
-            "name": "light",
-            "palette": palette,
-            "stylesheet": stylesheet,
-            "display_name": "Light Theme"
-        }
-    
-    def get_dark_theme(self):
-        """Get dark theme stylesheet and palette - FIXED TEXT VISIBILITY
-        
-        Returns:
-            Dictionary with theme components
-        """
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(43, 43, 43))
-        palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Base, QColor(30, 30, 30))
-        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        palette.setColor(QPalette.Text, QColor(255, 255, 255))
-        palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        
-        # Dark theme stylesheet - FIXED TEXT VISIBILITY
-        stylesheet = """
+
+_DARK_PALETTE_SPEC = (
+    (QPalette.Window, 43, 43, 43),
+    (QPalette.WindowText, 255, 255, 255),
+    (QPalette.Base, 30, 30, 30),
+    (QPalette.AlternateBase, 53, 53, 53),
+    (QPalette.Text, 255, 255, 255),
+    (QPalette.Button, 53, 53, 53),
+    (QPalette.ButtonText, 255, 255, 255),
+    (QPalette.Link, 42, 130, 218),
+    (QPalette.Highlight, 42, 130, 218),
+    (QPalette.HighlightedText, 255, 255, 255),
+)
+
+# Dark theme stylesheet - FIXED TEXT VISIBILITY
+_DARK_QSS = """
             QMainWindow {
                 background-color: #2b2b2b;
                 color: #ffffff;
@@ -286,34 +239,22 @@ class ThemeManager(QObject):
                 width: 0px;
             }
         """
-        
-        return {
-            "name": "dark",
-            "palette": palette,
-            "stylesheet": stylesheet,
-            "display_name": "Dark Theme"
-        }
-    
-    def get_professional_theme(self):
-        """Get professional theme with enhanced contrast - RENAMED AND IMPROVED
-        
-        Returns:
-            Dictionary with theme components
-        """
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(24, 24, 27))
-        palette.setColor(QPalette.WindowText, QColor(231, 233, 237))
-        palette.setColor(QPalette.Base, QColor(32, 33, 36))
-        palette.setColor(QPalette.AlternateBase, QColor(45, 45, 50))
-        palette.setColor(QPalette.Text, QColor(231, 233, 237))
-        palette.setColor(QPalette.Button, QColor(45, 45, 50))
-        palette.setColor(QPalette.ButtonText, QColor(231, 233, 237))
-        palette.setColor(QPalette.Link, QColor(66, 133, 244))
-        palette.setColor(QPalette.Highlight, QColor(66, 133, 244))
-        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        
-        # Professional theme stylesheet - ENHANCED CONTRAST
-        stylesheet = """
+
+_PROFESSIONAL_PALETTE_SPEC = (
+    (QPalette.Window, 24, 24, 27),
+    (QPalette.WindowText, 231, 233, 237),
+    (QPalette.Base, 32, 33, 36),
+    (QPalette.AlternateBase, 45, 45, 50),
+    (QPalette.Text, 231, 233, 237),
+    (QPalette.Button, 45, 45, 50),
+    (QPalette.ButtonText, 231, 233, 237),
+    (QPalette.Link, 66, 133, 244),
+    (QPalette.Highlight, 66, 133, 244),
+    (QPalette.HighlightedText, 255, 255, 255),
+)
+
+# Professional theme stylesheet - ENHANCED CONTRAST
+_PROFESSIONAL_QSS = """
             QMainWindow {
                 background-color: #18181b;
                 color: #e7e9ed;
@@ -471,19 +412,127 @@ class ThemeManager(QObject):
                 width: 0px;
             }
         """
+
+
+@functools.lru_cache(maxsize=None)
+def _make_palette(color_spec):
+    """Build a palette from (role, r, g, b) tuples - once per spec, on first use
+    
+    Built lazily rather than at import so no QPalette is made before QApplication exists.
+    """
+    palette = QPalette()
+    for role, red, green, blue in color_spec:
+        palette.setColor(role, QColor(red, green, blue))
+    return palette
+
+
+class ThemeManager(QObject):
+    """Manager for application themes and styling with improved dark mode support"""
+    
+    # SIGNALS
+    theme_applied = Signal(str)  # Emits theme name when applied
+    
+    # Display names, kept here so listing themes does not build them
+    _DISPLAY_NAMES = {
+        "light": "Light Theme",
+        "dark": "Dark Theme",
+        "professional": "Professional Dark",
+    }
+    
+    def __init__(self, settings_manager=None, parent=None):
+        """Initialize the theme manager
+        
+        Args:
+            settings_manager: SettingsManager instance for accessing saved theme
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.settings = settings_manager
+        self.current_theme = "dark"  # Default theme
+        
+        # Theme builders - each theme is built on first use and cached
+        self._theme_builders = {
+            "light": self.get_light_theme,
+            "dark": self.get_dark_theme,
+            "professional": self.get_professional_theme,  # RENAMED FROM PRO_DARK
+        }
+        self._themes_cache = {}
+        self._applied_theme = None  # Theme last pushed to QApplication
+        
+        # Load saved theme if available
+        if self.settings:
+            saved_theme = self.settings.get_theme()
+            # Handle legacy theme names
+            if saved_theme == "pro_dark":
+                saved_theme = "professional"
+            if saved_theme in self._theme_builders:
+                self.current_theme = saved_theme
+    
+    def _get_theme(self, theme_name):
+        """Get a theme's components, building them on first access
+        
+        Args:
+            theme_name: Name of the theme
+            
+        Returns:
+            Dictionary with theme components, or None for an unknown name
+        """
+        theme = self._themes_cache.get(theme_name)
+        if theme is None:
+            builder = self._theme_builders.get(theme_name)
+            if builder is None:
+                return None
+            theme = self._themes_cache[theme_name] = builder()
+        return theme
+    
+    def get_light_theme(self):
+        """Get light theme stylesheet and palette
         
+        Returns:
+            Dictionary with theme components
+        """
+        return {
+            "name": "light",
+            "palette": _make_palette(_LIGHT_PALETTE_SPEC),
+            "stylesheet": _LIGHT_QSS,
+            "display_name": self._DISPLAY_NAMES["light"]
+        }
+    
+    def get_dark_theme(self):
+        """Get dark theme stylesheet and palette - FIXED TEXT VISIBILITY
+        
+        Returns:
+            Dictionary with theme components
+        """
+        return {
+            "name": "dark",
+            "palette": _make_palette(_DARK_PALETTE_SPEC),
+            "stylesheet": _DARK_QSS,
+            "display_name": self._DISPLAY_NAMES["dark"]
+        }
+    
+    def get_professional_theme(self):
+        """Get professional theme with enhanced contrast - RENAMED AND IMPROVED
+        
+        Returns:
+            Dictionary with theme components
+        """
         return {
             "name": "professional",
-            "palette": palette,
-            "stylesheet": stylesheet,
-            "display_name": "Professional Dark"
+            "palette": _make_palette(_PROFESSIONAL_PALETTE_SPEC),
+            "stylesheet": _PROFESSIONAL_QSS,
+            "display_name": self._DISPLAY_NAMES["professional"]
         }
     
-    def apply_theme(self, theme_name=None):
+    def apply_theme(self, theme_name=None, force=False):
         """Apply a theme to the application
         
+        Re-applying the theme that is already active is skipped, since
+        setPalette/setStyleSheet re-polish every widget.
+        
         Args:
             theme_name: Name of the theme to apply (optional)
+            force: Re-apply even if the theme is already active
             
         Returns:
             True if successful, False otherwise
@@ -495,11 +544,16 @@ class ThemeManager(QObject):
         if theme_name == "pro_dark":
             theme_name = "professional"
         
+        # Already applied - nothing to re-polish
+        if theme_name == self._applied_theme and not force:
+            self.theme_applied.emit(theme_name)
+            return True
+        
         # Find theme
-        theme = self.themes.get(theme_name)
+        theme = self._get_theme(theme_name)
         if not theme:
             # Default to dark theme if not found
-            theme = self.themes.get("dark")
+            theme = self._get_theme("dark")
             theme_name = "dark"
         
         try:
@@ -516,6 +570,7 @@ class ThemeManager(QObject):
             
             # Update current theme
             self.current_theme = theme_name
+            self._applied_theme = theme_name
             
             # Save theme in settings if available
             if self.settings:
@@ -536,7 +591,7 @@ class ThemeManager(QObject):
         Returns:
             List of theme names
         """
-        return list(self.themes.keys())
+        return list(self._theme_builders.keys())
     
     def get_theme_display_names(self):
         """Get list of theme display names with theme name keys
@@ -544,8 +599,8 @@ class ThemeManager(QObject):
         Returns:
             Dictionary of {name: display_name} pairs
         """
-        return {name: theme.get("display_name", name.title()) 
-                for name, theme in self.themes.items()}
+        return {name: self._DISPLAY_NAMES.get(name, name.title())
+                for name in self._theme_builders}
     
     def get_current_theme(self):
         """Get current theme name
@@ -267,7 +267,9 @@ class MainWindow(QMainWindow):
             log_attempt("DatabaseManager")
             self.db = DatabaseManager()
             log_ok("DatabaseManager")
-            
+            if self.settings:
+                self.settings.set_database_manager(self.db)  # Patient-ID counters live in the database
+
             if self.settings and self.db:
                 log_attempt("FileManager")
                 self.file_manager = FileManager(self.settings, self)
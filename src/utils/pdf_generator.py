@@ -34,6 +34,16 @@ except ImportError as e:
     print(f"❌ PIL (Pillow) module not found: {e}")
     print("❌ Install with: pip install Pillow")
 
+# THE IMAGE GRID HOLDS AT MOST TWO ROWS OF THREE
+MAX_REPORT_IMAGES = 6
+
+
+def image_count_label(images_labels):
+    """Count for logging; "?" for iterators so they are not consumed early"""
+    if images_labels is None:
+        return 0
+    return len(images_labels) if hasattr(images_labels, "__len__") else "?"
+
 # === ENHANCED ENDOSCOPY PDF CLASS WITH COMPREHENSIVE ERROR HANDLING ===
 class EndoscopyPDF:
     """FIXED: Custom PDF class for endoscopy reports with comprehensive error handling"""
@@ -50,13 +60,13 @@ class EndoscopyPDF:
             self.findings = str(findings) if findings else ""
             self.conclusions = str(conclusions) if conclusions else ""
             self.recommendations = str(recommendations) if recommendations else ""
-            self.images_labels = images_labels if images_labels else []
+            self.images_labels = images_labels if images_labels is not None else []
             
             # LOG RECEIVED DATA
             logging.info(f"EndoscopyPDF initialized:")
             logging.info(f"  Patient data keys: {list(self.patient_data.keys())}")
             logging.info(f"  Findings length: {len(self.findings)}")
-            logging.info(f"  Images count: {len(self.images_labels)}")
+            logging.info(f"  Images count: {image_count_label(self.images_labels)}")
             
             # CREATE PDF INSTANCE
             self.pdf = FPDF_MODULE()
@@ -189,7 +199,7 @@ class EndoscopyPDF:
     def render_images(self):
         """FIXED: Render images in PDF with enhanced error handling and centering"""
         try:
-            logging.info(f"Rendering {len(self.images_labels)} images...")
+            logging.info(f"Rendering {image_count_label(self.images_labels)} images...")
             
             self.pdf.set_font("Arial", "B", 9)
             box_width, box_height = 60, 39
@@ -197,11 +207,14 @@ class EndoscopyPDF:
             start_x = 10
             y_origin = self.pdf.get_y()
             
-            # Count actual images
+            # Count actual images - stop once the grid is full so images that
+            # can never be drawn are not even checked on disk
             valid_images = []
             for img_path, label in self.images_labels:
                 if img_path and Path(img_path).exists():
                     valid_images.append((img_path, label))
+                    if len(valid_images) == MAX_REPORT_IMAGES:
+                        break
                 else:
                     logging.warning(f"Image not found: {img_path}")
             
@@ -266,7 +279,7 @@ class EndoscopyPDF:
                             continue
             else:
                 # Original layout for 6+ images
-                for idx, (img_path, label) in enumerate(valid_images[:6]):
+                for idx, (img_path, label) in enumerate(valid_images[:MAX_REPORT_IMAGES]):
                     try:
                         row, col = divmod(idx, 3)
                         x = start_x + col * (box_width + spacing_x)
@@ -410,7 +423,7 @@ def generate_endoscopy_pdf(patient_data, findings, conclusions, recommendations,
         findings: Findings text string
         conclusions: Conclusions text string
         recommendations: Recommendations text string
-        images_labels: List of (image_path, label) tuples
+        images_labels: Iterable of (image_path, label) tuples; consumed lazily
         filename: Output filename
         
     Returns:
@@ -437,7 +450,7 @@ def generate_endoscopy_pdf(patient_data, findings, conclusions, recommendations,
         logger.info(f"Report title: {patient_data.get('report_title', 'NOT_FOUND')}")
         logger.info(f"Indication: {patient_data.get('indication', 'NOT_FOUND')}")
         logger.info(f"Findings length: {len(findings) if findings else 0}")
-        logger.info(f"Images count: {len(images_labels) if images_labels else 0}")
+        logger.info(f"Images count: {image_count_label(images_labels)}")
         logger.info(f"Output filename: {filename}")
         
         # CREATE DIRECTORY IF NEEDED
@@ -492,7 +505,7 @@ def generate_endoscopy_pdf_from_report_data(patient_data, report_data, images_la
     Args:
         patient_data: Dictionary with patient information
         report_data: Dictionary with report data (report_title, indication, findings, conclusions, recommendations)
-        images_labels: List of (image_path, label) tuples
+        images_labels: Iterable of (image_path, label) tuples; consumed lazily
         filename: Output filename
         
     Returns: